@@ -22,6 +22,7 @@ let g:loaded_vime = 1
 "   let g:vime_http_host = '127.0.0.1'
 "   let g:vime_http_port = 51789
 "   let g:vime_curl_cmd = 'curl'
+"   let g:vime_http_compress = 1   " ask for gzip-compressed responses
 
 " State
 let s:current_file = ''
@@ -86,6 +87,7 @@ function! s:CurlPost(url, body) abort
     let l:curl = get(g:, 'vime_curl_cmd', 'curl')
     let l:cmd = l:curl
         \ . ' -sS -X POST -H "Content-Type: application/json"'
+        \ . (get(g:, 'vime_http_compress', 0) ? ' --compressed' : '')
         \ . ' -d ' . shellescape(a:body)
         \ . ' ' . shellescape(a:url)
     return system(l:cmd)
@@ -8,15 +8,35 @@ Schema:
 }
 """
 
+import contextlib
+import hashlib
 import json
 import logging
 import os
 from typing import Dict, List, Optional
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 
 logger = logging.getLogger("vime.config")
 
 
+def _dumps(data) -> bytes:
+    """Serialize config data to indented, key-sorted UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS) + b"\n"
+    return json.dumps(data, indent=2, sort_keys=True).encode("utf-8") + b"\n"
+
+
+def _loads(raw: bytes):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
 class Config:
     """Load and persist per-table ordered column configuration."""
 
@@ -24,6 +44,9 @@ class Config:
         root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         self.path = path or os.path.join(root_dir, "config.json")
         self._tables: Dict[str, List[str]] = {}
+        self._hash: Optional[bytes] = None  # Digest of the bytes last read from/written to disk
+        self._batch_depth = 0
+        self._dirty = False
         self._load()
 
     def _load(self):
@@ -32,9 +55,11 @@ class Config:
             self._tables = {}
             return
         try:
-            with open(self.path, "r", encoding="utf-8") as handle:
-                data = json.load(handle)
+            with open(self.path, "rb") as handle:
+                raw = handle.read()
+            data = _loads(raw)
             self._tables = self._sanitize(data)
+            self._hash = self._digest(raw)
             logger.info("Loaded table config: %s (%d tables)", self.path, len(self._tables))
         except Exception as exc:
             logger.warning("Failed to load config %s: %s", self.path, exc)
@@ -49,28 +74,53 @@ class Config:
         for table_name, cols in data.items():
             if not isinstance(table_name, str) or not isinstance(cols, list):
                 continue
-            seen = set()
-            ordered = []
-            for col in cols:
-                if not isinstance(col, str):
-                    continue
-                if col in seen:
-                    continue
-                seen.add(col)
-                ordered.append(col)
+            ordered = list(dict.fromkeys(c for c in cols if isinstance(c, str)))
             out[table_name] = ordered
         return out
 
-    def save(self):
-        """Persist config atomically."""
+    @staticmethod
+    def _digest(data: bytes) -> bytes:
+        return hashlib.blake2b(data, digest_size=16).digest()
+
+    def save(self, fsync: bool = False):
+        """
+        Persist config atomically.
+
+        The write is skipped when the serialized content matches what is
+        already on disk, and deferred to the end of an enclosing batch().
+        Pass fsync=True to flush the data to stable storage before the
+        rename.
+        """
+        if self._batch_depth:
+            self._dirty = True
+            return
+        new = _dumps(self._tables)
+        digest = self._digest(new)
+        if digest == self._hash:
+            return
         parent = os.path.dirname(self.path)
         if parent:
             os.makedirs(parent, exist_ok=True)
         tmp_path = self.path + ".tmp"
-        with open(tmp_path, "w", encoding="utf-8") as handle:
-            json.dump(self._tables, handle, indent=2, sort_keys=True)
-            handle.write("\n")
+        with open(tmp_path, "wb") as handle:
+            handle.write(new)
+            if fsync:
+                handle.flush()
+                os.fsync(handle.fileno())
         os.replace(tmp_path, self.path)
+        self._hash = digest
+
+    @contextlib.contextmanager
+    def batch(self):
+        """Defer save() calls made inside the block to a single write on exit."""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._dirty:
+                self._dirty = False
+                self.save()
 
     def get_columns(self, table_name: str) -> Optional[List[str]]:
         cols = self._tables.get(table_name)
@@ -84,30 +134,22 @@ class Config:
 
         Existing order is preserved and newly discovered columns are appended.
         """
-        discovered = []
-        seen = set()
-        for col in discovered_columns:
-            col_name = str(col)
-            if col_name in seen:
-                continue
-            seen.add(col_name)
-            discovered.append(col_name)
+        # dict.fromkeys dedupes in insertion order without a Python-level loop
+        discovered = list(dict.fromkeys(map(str, discovered_columns)))
 
         current = self._tables.get(table_name, [])
-        updated = list(current)
-        changed = False
-
-        for col in discovered:
-            if col not in current:
-                updated.append(col)
-                changed = True
+        current_set = set(current)
+        new_cols = [col for col in discovered if col not in current_set]
+        updated = current + new_cols
+        changed = bool(new_cols)
 
         if table_name not in self._tables:
             updated = discovered
             changed = True
 
-        if changed:
-            self._tables[table_name] = updated
-            self.save()
+        if not changed:
+            return list(current)
 
+        self._tables[table_name] = updated
+        self.save()
         return list(self._tables.get(table_name, discovered))
\ No newline at end of file
@@ -6,14 +6,24 @@ Handles opening HDF5 files via pandas or h5py, listing datasets,
 and converting datasets into pandas DataFrames.
 """
 
+import os
 import sys
 import logging
+import numpy as np
 import pandas as pd
 import h5py
 
 
 logger = logging.getLogger("vime.data_loader")
 
+# HDF5 raw chunk cache, applied per open dataset. The library default (1 MiB)
+# is smaller than a single chunk of many compressed tables, so every repeated
+# read decompresses the same chunks again. A larger cache trades resident
+# memory (up to H5_CHUNK_CACHE_BYTES per dataset touched) for that work.
+H5_CHUNK_CACHE_BYTES = 256 * 1024 * 1024
+H5_CHUNK_CACHE_SLOTS = 50021  # prime, roughly 100x the chunks that fit in the cache
+H5_CHUNK_CACHE_W0 = 0.75
+
 
 class DataLoader:
     """Load and list HDF5 tables using pandas or h5py backends."""
@@ -23,11 +33,29 @@ class DataLoader:
         self.h5file = None         # h5py.File object (h5py fallback backend)
         self.backend = None        # "pandas" or "h5py"
         self.filepath = None       # Path to the currently open file
+        self._opened_mtime = None  # mtime of filepath when it was opened
+        self._table_list_cache = None  # ((filepath, mtime), tables) from list_tables
+        self._storer_cache = {}        # name -> pandas storer (pandas backend)
 
     @property
     def is_open(self):
         return self.backend is not None
 
+    def is_open_on(self, filepath):
+        """Return True if filepath is open and unchanged on disk since.
+
+        Paths that differ as strings still match when they name the same
+        file (symlinks, hard links, relative spellings).
+        """
+        if not self.is_open or self._opened_mtime is None:
+            return False
+        try:
+            if self.filepath != filepath and not os.path.samefile(self.filepath, filepath):
+                return False
+            return os.path.getmtime(self.filepath) == self._opened_mtime
+        except OSError:
+            return False
+
     def close(self):
         """Close any open file handles."""
         logger.info("Closing data handles")
@@ -45,17 +73,51 @@ class DataLoader:
             self.h5file = None
         self.backend = None
         self.filepath = None
+        self._opened_mtime = None
+        self._table_list_cache = None
+        self._storer_cache = {}
 
     def open(self, filepath):
-        """Open an HDF5 file and return the list of tables."""
+        """Open an HDF5 file and return the list of tables.
+
+        Both backends are opened with an enlarged chunk cache (see
+        H5_CHUNK_CACHE_BYTES), so table/info/plot requests that re-read the
+        same dataset hit memory instead of decompressing chunks again. The
+        cost is up to that many bytes of resident memory per dataset read.
+        """
         logger.info("Opening HDF5 file: %s", filepath)
         self.close()
         self.filepath = filepath
+        try:
+            self._opened_mtime = os.path.getmtime(filepath)
+        except OSError:
+            self._opened_mtime = None
 
-        # Try pandas HDFStore first (works for pandas-formatted H5 files)
+        # Probe with h5py first: PyTables (and thus pandas) stamps the root
+        # group with PYTABLES_FORMAT_VERSION, so plain HDF5 files are opened
+        # once and never pay for an HDFStore walk.
+        try:
+            probe = self._open_h5py(filepath)
+        except Exception as exc:
+            logger.exception("Failed to open HDF5 with h5py")
+            raise RuntimeError(f"Failed to open HDF5: {exc}") from exc
+        if "PYTABLES_FORMAT_VERSION" not in probe.attrs:
+            self.h5file = probe
+            self.backend = "h5py"
+            logger.info("Opened with h5py backend (no PyTables format marker)")
+            return self.list_tables()
+        probe.close()
+
+        # Try pandas HDFStore (works for pandas-formatted H5 files)
         pandas_ok = False
         try:
-            store = pd.HDFStore(filepath, mode="r")
+            store = pd.HDFStore(
+                filepath,
+                mode="r",
+                CHUNK_CACHE_SIZE=H5_CHUNK_CACHE_BYTES,
+                CHUNK_CACHE_NELMTS=H5_CHUNK_CACHE_SLOTS,
+                CHUNK_CACHE_PREEMPT=H5_CHUNK_CACHE_W0,
+            )
             keys = store.keys()
             if keys:
                 # Successfully opened with pandas and has tables
@@ -75,7 +137,7 @@ class DataLoader:
         # Fall back to h5py for non-pandas HDF5 files
         if not pandas_ok:
             try:
-                self.h5file = h5py.File(filepath, "r")
+                self.h5file = self._open_h5py(filepath)
                 self.backend = "h5py"
                 logger.info("Opened with h5py backend")
             except Exception as exc:
@@ -85,45 +147,108 @@ class DataLoader:
 
         return self.list_tables()
 
+    @staticmethod
+    def _open_h5py(filepath):
+        """Open a file read-only with h5py using the enlarged chunk cache."""
+        return h5py.File(
+            filepath,
+            "r",
+            rdcc_nbytes=H5_CHUNK_CACHE_BYTES,
+            rdcc_nslots=H5_CHUNK_CACHE_SLOTS,
+            rdcc_w0=H5_CHUNK_CACHE_W0,
+        )
+
     def list_tables(self):
-        """Return a list of dicts with table metadata."""
+        """Return a list of dicts with table metadata.
+
+        The listing is cached per (filepath, mtime), so repeated calls on an
+        unchanged file skip the metadata walk.
+        """
         logger.info("Listing tables (backend=%s)", self.backend)
+        if self.backend is None:
+            return []
+        try:
+            key = (self.filepath, os.path.getmtime(self.filepath))
+        except OSError:
+            key = None
+        if key is not None and self._table_list_cache is not None:
+            cached_key, cached_tables = self._table_list_cache
+            if cached_key == key:
+                return list(cached_tables)
+
         if self.backend == "h5py":
-            return self._get_table_list_h5py()
-        if self.backend == "pandas":
-            return self._get_table_list_pandas()
-        return []
+            tables = self._get_table_list_h5py()
+        else:
+            tables = self._get_table_list_pandas()
+        self._table_list_cache = (key, tables) if key is not None else None
+        return list(tables)
 
     def load_table(self, name):
         """Load a table/dataset as a DataFrame from either backend."""
         logger.info("Loading table: %s (backend=%s)", name, self.backend)
         if self.backend == "pandas":
-            if name not in self.store:
+            try:
+                return self.store[name]
+            except KeyError:
                 logger.warning("Table not found in pandas store: %s", name)
                 return None
-            return self.store[name]
         if self.backend == "h5py":
             return self._h5py_read_dataset(name)
         return None
 
-    def load_table_fast(self, name):
-        """Load a table/dataset as raw data, skipping pandas DataFrames."""
-        logger.info("Fast loading table: %s (backend=%s)", name, self.backend)
+    def load_table_fast(self, name, start=None, stop=None, out=None):
+        """Load a table/dataset as raw data, skipping pandas DataFrames.
+
+        ``start``/``stop`` select a row range (default: all rows), so only
+        the requested page is read from disk. ``out`` is an optional array
+        to read into (h5py backend); it is used when its shape and dtype
+        match the selection, otherwise a new array is returned.
+        """
+        logger.info(
+            "Fast loading table: %s (backend=%s start=%s stop=%s)",
+            name, self.backend, start, stop,
+        )
         if self.backend == "pandas":
             if name not in self.store:
                 logger.warning("Table not found in pandas store: %s", name)
                 return None
-            return self._pandas_read_table_fast(name)
+            return self._pandas_read_table_fast(name, start, stop)
         if self.backend == "h5py":
-            return self._h5py_read_dataset_raw(name)
+            return self._h5py_read_dataset_raw(name, start, stop, out)
         return None
 
+    def load_table_head(self, name, nrows):
+        """Read only the first nrows of a table as a DataFrame.
+
+        Returns ``(df, total_rows)``, or None when the table cannot be read
+        by row range (fixed-format pandas stores, scalar datasets); callers
+        then load the whole table instead.
+        """
+        if self.backend == "h5py":
+            return self._h5py_read_dataset_head(name, nrows)
+        if self.backend != "pandas" or name not in self.store:
+            return None
+        storer = self._get_storer(name)
+        if storer is None or not storer.is_table:
+            return None
+        try:
+            df = self.store.select(name, start=0, stop=nrows)
+        except Exception as exc:
+            logger.warning("Row-range read failed for %s: %s", name, exc)
+            return None
+        logger.info("Loaded head of table: %s (rows=%d)", name, len(df))
+        return df, int(storer.nrows)
+
     def _get_table_list_pandas(self):
         """Return table metadata using the pandas HDFStore backend."""
         tables = []
         for key in self.store.keys():
             try:
                 storer = self.store.get_storer(key)
+                if not storer.is_table:
+                    nrows, ncols = self._fixed_shape(storer)
+                    tables.append({"name": key, "rows": nrows, "cols": ncols})
+                    continue
                 nrows = int(storer.nrows) if hasattr(storer, "nrows") else "?"
                 if hasattr(storer, "ncols"):
                     ncols = int(storer.ncols)
@@ -141,43 +266,84 @@ class DataLoader:
         logger.info("Collected %d pandas tables", len(tables))
         return tables
 
+    @staticmethod
+    def _fixed_shape(storer):
+        """Return (rows, cols) of a fixed-format storer from its axis nodes.
+
+        Fixed storers have no nrows, and their ``shape`` property reads the
+        row count off the first value block, which is wrong when that block
+        holds pickled objects. The stored axes are exact and cheap to stat.
+        """
+        group = storer.group
+        if "axis1" in group and "axis0" in group:  # DataFrame: axis1 is the index
+            return int(group.axis1.shape[0]), int(group.axis0.shape[0])
+        if "index" in group:  # Series
+            return int(group.index.shape[0]), 1
+        return "?", "?"
+
     def _get_table_list_h5py(self):
         """Return dataset metadata using the h5py fallback backend."""
-        datasets = []
+        names = []
+        shapes = []
+        fid = self.h5file.id
+
+        # One pass: object type comes from H5Oget_info, so groups are skipped
+        # without building h5py Group/Dataset wrappers; datasets are opened
+        # at the low level just for their shape.
+        def _visitor(name, info):
+            if info.type == h5py.h5o.TYPE_DATASET:
+                names.append(name)
+                shapes.append(h5py.h5d.open(fid, name).shape)
+            return None
 
-        def _visitor(name, obj):
-            if isinstance(obj, h5py.Dataset):
-                shape = obj.shape
-                nrows = int(shape[0]) if len(shape) >= 1 else 1
-                ncols = int(shape[1]) if len(shape) >= 2 else 1
-                datasets.append({"name": "/" + name, "rows": nrows, "cols": ncols})
+        h5py.h5o.visit(fid, _visitor, info=True)
 
-        self.h5file.visititems(_visitor)
+        datasets = []
+        for name, shape in zip(names, shapes):
+            nrows = int(shape[0]) if len(shape) >= 1 else 1
+            ncols = int(shape[1]) if len(shape) >= 2 else 1
+            datasets.append({"name": "/" + name.decode("utf-8"), "rows": nrows, "cols": ncols})
         logger.info("Collected %d h5py datasets", len(datasets))
         return datasets
 
-    def _pandas_read_table_fast(self, name):
+    def _get_storer(self, name):
+        """Return the (cached) pandas storer for name, or None."""
+        storer = self._storer_cache.get(name)
+        if storer is None:
+            try:
+                storer = self.store.get_storer(name)
+            except Exception as exc:
+                logger.warning("Failed to get pandas storer for %s: %s", name, exc)
+                return None
+            self._storer_cache[name] = storer
+        return storer
+
+    def _pandas_read_table_fast(self, name, start=None, stop=None):
         """Read table data from pandas-backed HDF5 without DataFrames."""
-        try:
-            storer = self.store.get_storer(name)
-        except Exception as exc:
-            logger.warning("Failed to get pandas storer for %s: %s", name, exc)
+        storer = self._get_storer(name)
+        if storer is None:
             return None
 
         table = getattr(storer, "table", None)
         if table is not None:
             try:
-                return table.read()
+                # step=1 keeps PyTables on its contiguous-read fast path
+                return table.read(start=start, stop=stop, step=1)
             except Exception as exc:
                 logger.warning("Failed to read PyTables table for %s: %s", name, exc)
                 return None
 
-        if hasattr(storer, "_read_array"):
+        if not storer.is_table:
+            # Fixed format has no PyTables table to read rows from; the row
+            # range is read by the storer and handed back as plain records
             try:
-                return storer._read_array()
+                obj = storer.read(start=start, stop=stop)
             except Exception as exc:
-                logger.warning("Failed to read array for %s: %s", name, exc)
+                logger.warning("Failed to read fixed-format data for %s: %s", name, exc)
                 return None
+            if isinstance(obj, pd.DataFrame):
+                return obj.to_records(index=False)
+            return np.asarray(obj)
 
         logger.warning("Fast read not supported for pandas storer: %s", name)
         return None
@@ -194,12 +360,17 @@ class DataLoader:
             logger.warning("H5 object is not a dataset: %s", name)
             return None
 
-        arr = ds[()]
+        arr = self._try_memmap(ds)
+        if arr is None:
+            arr = ds[()]
         logger.info("Read dataset %s with shape %s", name, getattr(arr, "shape", "scalar"))
+        return self._array_to_frame(arr)
 
+    def _array_to_frame(self, arr):
+        """Wrap a dataset array in a DataFrame without copying it."""
         # Handle structured arrays (compound dtypes, e.g. from MATLAB)
         if arr.dtype.names is not None:
-            return pd.DataFrame({col: arr[col] for col in arr.dtype.names})
+            return self._struct_to_frame(arr)
 
         # Scalar
         if arr.ndim == 0:
@@ -207,17 +378,67 @@ class DataLoader:
 
         # 1-D array
         if arr.ndim == 1:
-            return pd.DataFrame({0: arr})
+            return pd.DataFrame({0: arr}, copy=False)
 
         # 2-D array
         if arr.ndim == 2:
-            return pd.DataFrame(arr)
+            return pd.DataFrame(arr, copy=False)
 
         # Higher-dimensional: flatten trailing dims
         reshaped = arr.reshape(arr.shape[0], -1)
-        return pd.DataFrame(reshaped)
+        return pd.DataFrame(reshaped, copy=False)
+
+    @staticmethod
+    def _struct_to_frame(arr):
+        """Convert a structured array to a DataFrame, sharing memory when possible.
+
+        Packed compounds whose fields all share one numeric dtype are viewed
+        as a 2-D array, which pandas wraps without copying field by field.
+        Mixed compounds keep one strided view per field, one block each.
+        """
+        names = arr.dtype.names
+        first = arr.dtype[0]
+        uniform = (
+            arr.ndim == 1
+            and arr.flags.c_contiguous
+            and first.kind in "iuf"
+            and first.shape == ()
+            and arr.dtype.itemsize == first.itemsize * len(names)
+            and all(
+                arr.dtype.fields[col][0] == first
+                and arr.dtype.fields[col][1] == i * first.itemsize
+                for i, col in enumerate(names)
+            )
+        )
+        if uniform:
+            view = arr.view(first).reshape(len(arr), len(names))
+            return pd.DataFrame(view, columns=list(names), copy=False)
+        # Numeric fields are shared as-is; bytes/strings become object
+        # columns, matching what the copying constructor produced.
+        columns = {}
+        for col in names:
+            field = arr[col]
+            columns[col] = field if field.dtype.kind in "biufcmM" else field.astype(object)
+        return pd.DataFrame(columns, copy=False)
+
+    def _h5py_read_dataset_head(self, name, nrows):
+        """Read the first nrows of an h5py dataset as a DataFrame.
+
+        Only the chunks holding those rows are read (or, for contiguous
+        numeric data, only those pages of the memory map are touched).
+        """
+        key = name.lstrip("/")
+        if key not in self.h5file:
+            return None
+        ds = self.h5file[key]
+        if not isinstance(ds, h5py.Dataset) or ds.ndim == 0:
+            return None
+        arr = self._try_memmap(ds)
+        arr = ds[:nrows] if arr is None else arr[:nrows]
+        logger.info("Read head of dataset %s (rows=%d)", name, len(arr))
+        return self._array_to_frame(arr), int(ds.shape[0])
 
-    def _h5py_read_dataset_raw(self, name):
+    def _h5py_read_dataset_raw(self, name, start=None, stop=None, out=None):
         """Read an h5py dataset and return raw data without DataFrames."""
         key = name.lstrip("/")
         if key not in self.h5file:
@@ -227,4 +448,39 @@ class DataLoader:
         if not isinstance(ds, h5py.Dataset):
             logger.warning("H5 object is not a dataset: %s", name)
             return None
-        return ds[()]
+        sliced = (start is not None or stop is not None) and ds.ndim > 0
+        arr = self._try_memmap(ds)
+        if arr is not None:
+            return arr[start:stop] if sliced else arr
+        if out is not None and ds.ndim > 0:
+            rows = range(ds.shape[0])[start:stop] if sliced else range(ds.shape[0])
+            if out.dtype == ds.dtype and out.shape == (len(rows),) + ds.shape[1:]:
+                if len(rows):
+                    ds.read_direct(out, source_sel=np.s_[rows.start:rows.stop])
+                return out
+        return ds[start:stop] if sliced else ds[()]
+
+    def _try_memmap(self, ds):
+        """Memory-map a contiguous, uncompressed numeric dataset.
+
+        Pages are only read from disk when touched, so previews of huge
+        datasets cost O(rows shown) memory instead of O(dataset). Returns
+        None when the dataset is chunked, filtered, not yet allocated, or
+        not a plain int/float type; callers then fall back to ``ds[()]``.
+        """
+        if ds.chunks is not None or ds.compression is not None:
+            return None
+        if ds.dtype.kind not in "iuf" or ds.ndim == 0:
+            return None
+        try:
+            offset = ds.id.get_offset()
+        except Exception:
+            return None
+        if offset is None:
+            return None
+        try:
+            return np.memmap(self.filepath, dtype=ds.dtype, mode="r",
+                             offset=offset, shape=ds.shape)
+        except Exception as exc:
+            logger.warning("Memory-map failed for %s, reading eagerly: %s", ds.name, exc)
+            return None
@@ -1,6 +1,11 @@
 import logging
 import numpy as np
 
+try:
+    import numba
+except ImportError:  # optional: line drawing falls back to NumPy
+    numba = None
+
 
 logger = logging.getLogger("vime.plotter")
 
@@ -15,7 +20,92 @@ BRAILLE_MAP = [
     [0x01, 0x02, 0x04, 0x40],  # left column  (dx=0), rows 0-3
     [0x08, 0x10, 0x20, 0x80],  # right column (dx=1), rows 0-3
 ]
-
+# Flattened lookup table indexed by (dx << 2) | dy
+BRAILLE_LUT = np.array(BRAILLE_MAP, dtype=np.uint8).ravel()
+
+
+def _draw_line(cells, x0, y0, x1, y1, pw, ph, lut):
+    """Bresenham line into a braille cell array; pixels outside [0, pw]x[0, ph] are skipped."""
+    dx = abs(x1 - x0)
+    dy = abs(y1 - y0)
+    sx = 1 if x0 < x1 else -1
+    sy = 1 if y0 < y1 else -1
+    err = dx - dy
+
+    while True:
+        if 0 <= x0 <= pw and 0 <= y0 <= ph:
+            cells[y0 >> 2, x0 >> 1] |= lut[(x0 & 1) << 2 | (y0 & 3)]
+        if x0 == x1 and y0 == y1:
+            break
+        e2 = 2 * err
+        if e2 > -dy:
+            err -= dy
+            x0 += sx
+        if e2 < dx:
+            err += dx
+            y0 += sy
+
+
+def _draw_lines(cells, px, py, pw, ph, lut):
+    """Draw connected segments through (px[i], py[i]) with _draw_line."""
+    for i in range(1, len(px)):
+        _draw_line(cells, px[i - 1], py[i - 1], px[i], py[i], pw, ph, lut)
+
+
+if numba is not None:
+    _draw_line = numba.njit(cache=True)(_draw_line)
+    # Compiled after _draw_line so the segment loop calls the jitted version
+    _draw_lines = numba.njit(cache=True)(_draw_lines)
+
+
+# Inputs longer than this use the multi-threaded numba filter when available
+PARALLEL_FILTER_MIN = 100_000
+
+
+def _finite_pairs_parallel(x, y):
+    """Stream-compact finite (x, y) pairs: count per chunk, prefix-sum, copy."""
+    n = len(x)
+    nchunks = numba.get_num_threads()
+    size = (n + nchunks - 1) // nchunks
+    counts = np.zeros(nchunks + 1, dtype=np.int64)
+    for c in numba.prange(nchunks):
+        count = 0
+        for i in range(c * size, min(n, (c + 1) * size)):
+            if np.isfinite(x[i]) and np.isfinite(y[i]):
+                count += 1
+        counts[c + 1] = count
+    offsets = np.cumsum(counts)
+    xf = np.empty(offsets[-1], dtype=x.dtype)
+    yf = np.empty(offsets[-1], dtype=y.dtype)
+    for c in numba.prange(nchunks):
+        j = offsets[c]
+        for i in range(c * size, min(n, (c + 1) * size)):
+            if np.isfinite(x[i]) and np.isfinite(y[i]):
+                xf[j] = x[i]
+                yf[j] = y[i]
+                j += 1
+    return xf, yf
+
+
+if numba is not None:
+    # No fastmath here: it lets the compiler assume NaN/inf never occur
+    _finite_pairs_parallel = numba.njit(parallel=True, cache=True)(_finite_pairs_parallel)
+
+
+def filter_finite_pairs(x, y):
+    """Return x, y with every pair containing a NaN or inf removed.
+
+    Large inputs go through a parallel numba kernel when numba is
+    installed; otherwise one NumPy mask is built and applied. Arrays are
+    returned unchanged when all pairs are finite.
+    """
+    if numba is not None and len(x) > PARALLEL_FILTER_MIN:
+        return _finite_pairs_parallel(x, y)
+    mask = np.isfinite(x)
+    np.logical_and(mask, np.isfinite(y), out=mask)
+    if mask.all():
+        return x, y
+    return np.compress(mask, x), np.compress(mask, y)
 
 
 class BrailleCanvas:
@@ -35,44 +125,119 @@ class BrailleCanvas:
         self.char_height = height
         self.pixel_width = width * 2
         self.pixel_height = height * 4
-        self._cells = [[0] * width for _ in range(height)]
+        self._cells = np.zeros((height, width), dtype=np.uint8)
 
     def set_pixel(self, px, py):
         """Set a sub-pixel at coordinates (px, py)."""
-        if px < 0 or px >= self.pixel_width or py < 0 or py >= self.pixel_height:
+        if (px | py) < 0 or px >= self.pixel_width or py >= self.pixel_height:
+            return
+        self._cells[py >> 2, px >> 1] |= BRAILLE_LUT[(px & 1) << 2 | (py & 3)]
+
+    def set_pixels(self, px, py):
+        """Set many sub-pixels at once from integer coordinate arrays.
+
+        Coordinates must already lie inside the canvas. Points are first
+        marked on a boolean sub-pixel grid, so colliding points cost one
+        O(N) scatter; the grid is then folded into braille bits per cell,
+        which is O(canvas) however many points there were.
+        """
+        if len(px) == 0:
             return
-        cx = px // 2
-        cy = py // 4
-        dx = px % 2
-        dy = py % 4
-        self._cells[cy][cx] |= BRAILLE_MAP[dx][dy]
+        hit = np.zeros((self.pixel_height, self.pixel_width), dtype=np.uint8)
+        hit[py, px] = 1
+        # (row, dy, col, dx) -> (row, col, dx, dy): the last two axes flatten
+        # to the (dx << 2) | dy LUT index; the LUT bits are disjoint, so a
+        # dot product is their OR.
+        block = hit.reshape(self.char_height, 4, self.char_width, 2).transpose(0, 2, 3, 1)
+        self._cells |= block.reshape(self.char_height, self.char_width, 8) @ BRAILLE_LUT
 
     def line(self, x0, y0, x1, y1):
         """Draw a line using Bresenham's algorithm on the sub-pixel grid."""
-        dx = abs(x1 - x0)
-        dy = abs(y1 - y0)
-        sx = 1 if x0 < x1 else -1
-        sy = 1 if y0 < y1 else -1
-        err = dx - dy
-
-        while True:
-            self.set_pixel(x0, y0)
-            if x0 == x1 and y0 == y1:
-                break
-            e2 = 2 * err
-            if e2 > -dy:
-                err -= dy
-                x0 += sx
-            if e2 < dx:
-                err += dx
-                y0 += sy
+        _draw_line(self._cells, int(x0), int(y0), int(x1), int(y1),
+                   self.pixel_width - 1, self.pixel_height - 1, BRAILLE_LUT)
+
+    def lines(self, px, py):
+        """Draw connected segments through the points (px[i], py[i]).
+
+        Segments are drawn by the same Bresenham loop as line(), compiled
+        with numba when available and plain Python otherwise, so plots come
+        out pixel-identical either way. braille_plot passes paths already
+        reduced to a few points per pixel column, which keeps the Python
+        loop cheap.
+        """
+        if len(px) < 2:
+            return
+        if numba is None:
+            # Python ints index numpy far faster than numpy scalars do
+            px, py = px.tolist(), py.tolist()
+        _draw_lines(self._cells, px, py, self.pixel_width - 1,
+                    self.pixel_height - 1, BRAILLE_LUT)
 
     def render(self):
         """Return list of strings (one per character row)."""
-        lines = []
-        for row in self._cells:
-            lines.append("".join(chr(0x2800 + cell) for cell in row))
-        return lines
+        # Rows of UTF-32 code points reinterpreted as fixed-width str
+        # scalars: each row becomes one string without per-char chr().
+        codes = self._cells.astype("<u4") + 0x2800
+        return codes.view(f"<U{self.char_width}").ravel().tolist()
+
+
+def _is_nondecreasing(x):
+    """True when x is already sorted ascending (an O(N) check)."""
+    return len(x) < 2 or bool(np.all(x[1:] >= x[:-1]))
+
+
+def _decimate_columns(px, py):
+    """Reduce a line path sorted by px to at most 4 points per pixel column.
+
+    Within one column the path is a vertical run that covers [min, max] of
+    its py values, so walking first -> min -> max -> last and then on to the
+    next column's first point rasterizes exactly the same pixels as the
+    full path, while the segment count drops from N to O(plot width).
+    """
+    if len(px) < 2:
+        return px, py
+    starts = np.flatnonzero(np.diff(px, prepend=px[0] - 1))
+    if len(starts) * 4 >= len(px):
+        return px, py
+    ends = np.append(starts[1:], len(px)) - 1
+    cols = px[starts]
+    reduced_y = np.column_stack([
+        py[starts],
+        np.minimum.reduceat(py, starts),
+        np.maximum.reduceat(py, starts),
+        py[ends],
+    ])
+    return np.repeat(cols, 4), reduced_y.ravel()
+
+
+def _decimate_unsorted(x, px, py):
+    """_decimate_columns for points not sorted by x, without sorting them.
+
+    Per pixel column the y range and the x extremes are scattered into
+    small per-column tables (O(N) ``ufunc.at`` passes); the column's first
+    and last points in x order are the ones at its min and max x. Columns
+    come out in ascending order, giving the same reduced path as sorting.
+    """
+    if len(px) < 2:
+        return px, py
+    ncols = int(px.max()) + 1
+    y_lo = np.full(ncols, np.iinfo(py.dtype).max, dtype=py.dtype)
+    y_hi = np.full(ncols, -1, dtype=py.dtype)
+    x_lo = np.full(ncols, np.inf)
+    x_hi = np.full(ncols, -np.inf)
+    np.minimum.at(y_lo, px, py)
+    np.maximum.at(y_hi, px, py)
+    np.minimum.at(x_lo, px, x)
+    np.maximum.at(x_hi, px, x)
+    y_first = np.empty_like(y_lo)
+    y_last = np.empty_like(y_hi)
+    at = x == x_lo[px]
+    y_first[px[at]] = py[at]
+    at = x == x_hi[px]
+    y_last[px[at]] = py[at]
+    cols = np.flatnonzero(y_hi >= 0)
+    reduced_y = np.column_stack([y_first[cols], y_lo[cols], y_hi[cols], y_last[cols]])
+    return np.repeat(cols, 4), reduced_y.ravel()
 
 
 def braille_plot(x, y, width=72, height=20, x_label="x", y_label="y",
@@ -134,31 +299,38 @@ def braille_plot(x, y, width=72, height=20, x_label="x", y_label="y",
     ph = canvas.pixel_height - 1
     logger.debug("Canvas size: %sx%s pixels", canvas.pixel_width, canvas.pixel_height)
 
+    # Per-axis scale computed once: one multiply per point instead of a
+    # divide and a multiply (y is flipped, so it is measured from y_max)
+    x_scale = pw / (x_max - x_min)
+    y_scale = ph / (y_max - y_min)
+
     def to_pixel(xv, yv):
-        px = int(round((xv - x_min) / (x_max - x_min) * pw))
-        py = int(round((1.0 - (yv - y_min) / (y_max - y_min)) * ph))
-        px = max(0, min(pw, px))
-        py = max(0, min(ph, py))
+        tx = xv - x_min
+        tx *= x_scale
+        ty = y_max - yv
+        ty *= y_scale
+        px = np.rint(tx, out=tx).astype(np.intp)
+        py = np.rint(ty, out=ty).astype(np.intp)
+        # Clip in place: the intp arrays are fresh, no need for two more
+        np.clip(px, 0, pw, out=px)
+        np.clip(py, 0, ph, out=py)
         return px, py
 
     if plot_type == "line":
-        # Sort by x for line drawing
-        order = np.argsort(x)
-        xs, ys = x[order], y[order]
-
-        for i in range(len(xs)):
-            px, py = to_pixel(xs[i], ys[i])
-            canvas.set_pixel(px, py)
-
-            # Draw line segments between consecutive points
-            if i > 0:
-                px0, py0 = to_pixel(xs[i - 1], ys[i - 1])
-                canvas.line(px0, py0, px, py)
+        # Walk the points in x order; index/time columns usually already are
+        # sorted, anything else is grouped by pixel column without a full sort
+        px, py = to_pixel(x, y)
+        if _is_nondecreasing(x):
+            px, py = _decimate_columns(px, py)
+        else:
+            px, py = _decimate_unsorted(x, px, py)
+        canvas.set_pixels(px, py)
+        # Draw line segments between consecutive points
+        canvas.lines(px, py)
     else:
         # Scatter plot
-        for i in range(len(x)):
-            px, py = to_pixel(x[i], y[i])
-            canvas.set_pixel(px, py)
+        px, py = to_pixel(np.asarray(x), np.asarray(y))
+        canvas.set_pixels(px, py)
 
     # Render the canvas
     braille_lines = canvas.render()
@@ -185,11 +357,11 @@ def braille_plot(x, y, width=72, height=20, x_label="x", y_label="y",
     mid_label = _format_num((x_min + x_max) / 2, 8)
     right_label = _format_num(x_max, 8)
 
-    tick_str = list(" " * plot_width)
+    tick_str = bytearray(b" " * plot_width)
     _place_label(tick_str, 0, left_label)
     _place_label(tick_str, plot_width // 2 - len(mid_label) // 2, mid_label)
     _place_label(tick_str, plot_width - len(right_label), right_label)
-    lines.append(" " * y_axis_width + " " + "".join(tick_str))
+    lines.append(" " * y_axis_width + " " + tick_str.decode("ascii"))
 
     # Axis labels
     lines.append("")
@@ -201,9 +373,10 @@ def braille_plot(x, y, width=72, height=20, x_label="x", y_label="y",
 
 def _format_num(val, max_width):
     """Format a number to fit within max_width characters."""
+    abs_val = abs(val)
     if val == 0:
         s = "0"
-    elif abs(val) < 0.01 or abs(val) >= 1e6:
+    elif abs_val < 0.01 or abs_val >= 1e6:
         s = f"{val:.2e}"
     elif val == int(val):
         s = str(int(val))
@@ -214,9 +387,9 @@ def _format_num(val, max_width):
     return s[:max_width]
 
 
-def _place_label(char_list, pos, label):
-    """Place a label string into a character list at the given position."""
-    for i, ch in enumerate(label):
-        idx = pos + i
-        if 0 <= idx < len(char_list):
-            char_list[idx] = ch
+def _place_label(buf, pos, label):
+    """Place an ASCII label into a bytearray at the given position, clipped to its bounds."""
+    start = max(0, pos)
+    end = min(len(buf), pos + len(label))
+    if start < end:
+        buf[start:end] = label[start - pos:end - pos].encode("ascii")
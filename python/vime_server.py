@@ -15,36 +15,156 @@ import threading
 import time
 import logging
 import argparse
+import collections
 import errno
+import functools
+import io
+import socket
+import types
+import warnings
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
-from urllib.parse import urlparse
-from plotter import braille_plot
+from plotter import braille_plot, filter_finite_pairs
 import numpy as np
-from tabulate import tabulate
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
 from data_loader import DataLoader
 from test_compute import test_compute
 from config import Config
 
 
 
+def _numpy_subtypes(base):
+    """Yield base and every numpy scalar class derived from it."""
+    stack = [base]
+    while stack:
+        cls = stack.pop()
+        yield cls
+        stack.extend(cls.__subclasses__())
+
+
+# Exact-type converters for NumpyEncoder; numpy scalar classes are final,
+# so one dict hit replaces the isinstance chain for the common cases. The
+# hierarchy is walked at import (np.sctypes is gone in NumPy 2), which also
+# picks up platform aliases such as intc/longlong and longdouble.
+_NUMPY_DISPATCH = {np.bool_: bool, np.ndarray: np.ndarray.tolist}
+_NUMPY_DISPATCH.update(dict.fromkeys(_numpy_subtypes(np.integer), int))
+_NUMPY_DISPATCH.update(dict.fromkeys(_numpy_subtypes(np.floating), float))
+
+
 class NumpyEncoder(json.JSONEncoder):
     """JSON encoder that handles numpy types transparently."""
 
-    def default(self, obj):
-        if isinstance(obj, np.integer):
+    # default() runs once per non-JSON value, so the lookups it needs are
+    # bound as default arguments (locals) rather than resolved per call.
+    def default(self, obj, _dispatch=_NUMPY_DISPATCH.get, _integer=np.integer,
+                _floating=np.floating, _bool=np.bool_, _ndarray=np.ndarray):
+        convert = _dispatch(type(obj))
+        if convert is not None:
+            return convert(obj)
+        if isinstance(obj, _integer):
             return int(obj)
-        if isinstance(obj, np.floating):
+        if isinstance(obj, _floating):
             return float(obj)
-        if isinstance(obj, np.bool_):
+        if isinstance(obj, _bool):
             return bool(obj)
-        if isinstance(obj, np.ndarray):
+        if isinstance(obj, _ndarray):
             return obj.tolist()
+        if hasattr(obj, "isoformat"):
+            return obj.isoformat()
         return super().default(obj)
 
 
+# Shared encoder for HTTP responses; ensure_ascii=False keeps braille and
+# other non-ASCII text as raw UTF-8 instead of \uXXXX escapes.
+RESPONSE_ENCODER = NumpyEncoder(ensure_ascii=False)
+RESPONSE_CHUNK_BYTES = 64 * 1024  # Encoded pieces are coalesced up to this size
+
+if orjson is not None:
+    ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _orjson_default(obj):
+    """Fallback for values orjson does not serialize natively."""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if hasattr(obj, "isoformat"):  # pandas Timestamp and other datetime-likes
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+MSGPACK_MEDIA_TYPE = "application/x-msgpack"
+
+
+def _is_number(val):
+    """True when tabulate would read val as a number (numeric strings included)."""
+    try:
+        float(val)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+def _msgpack_default(obj):
+    """Fallback for values msgpack does not serialize natively.
+
+    Arrays are sent as raw bytes with a dtype/shape sidecar so large
+    numeric payloads skip per-element conversion.
+    """
+    if isinstance(obj, np.ndarray):
+        if obj.dtype.kind in "biuf":
+            return {
+                "dtype": obj.dtype.str,
+                "shape": list(obj.shape),
+                "data": np.ascontiguousarray(obj).tobytes(),
+            }
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not msgpack serializable")
+
+
+def encode_response(payload):
+    """Encode a response payload as a list of UTF-8 byte chunks.
+
+    orjson produces the whole body in one C call. Without it the stdlib
+    encoder is walked piecewise, so a large table/plot string is never held
+    as both a full str and a full bytes copy of the response.
+    """
+    if orjson is not None:
+        return [orjson.dumps(payload, default=_orjson_default, option=ORJSON_OPTIONS)]
+    chunks = []
+    buf = bytearray()
+    for piece in RESPONSE_ENCODER.iterencode(payload):
+        buf += piece.encode("utf-8")
+        if len(buf) >= RESPONSE_CHUNK_BYTES:
+            chunks.append(buf)
+            buf = bytearray()
+    if buf:
+        chunks.append(buf)
+    return chunks
+
 logger = logging.getLogger("vime")
 
 
+@functools.lru_cache(maxsize=128)
+def _normalize_path(path):
+    """Return the absolute, case-normalized form of path (memoized)."""
+    return os.path.normcase(os.path.abspath(path))
+
+
 def configure_logging():
     if logger.handlers:
         return
@@ -58,24 +178,105 @@ def configure_logging():
 
 
 class VimeHTTPServer(ThreadingHTTPServer):
-    """Threaded HTTP server with strict port exclusivity."""
+    """Threaded HTTP server with strict port exclusivity.
+
+    Requests run on a bounded pool of reused worker threads instead of a
+    new thread per connection.
+    """
 
     allow_reuse_address = False
+    daemon_threads = True
+    max_workers = 8  # Leaves headroom for compute_status long polls
+    send_buffer = 1 << 20  # SO_SNDBUF for accepted sockets; large tables go out in fewer writes
+    _pool = None
+    _active = 0  # Connections submitted to the pool and not yet finished
+    _active_lock = threading.Lock()
+
+    def keepalive_allowed(self):
+        """False once every pooled worker is taken, so idle connections let go of theirs."""
+        with self._active_lock:
+            return self._active < self.max_workers
+
+    def _process_pooled(self, request, client_address):
+        try:
+            self.process_request_thread(request, client_address)
+        finally:
+            with self._active_lock:
+                self._active -= 1
+
+    def process_request(self, request, client_address):
+        try:
+            # Small replies should not wait on Nagle for the client's ACK.
+            request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            request.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.send_buffer)
+        except OSError:
+            pass
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="vime-http"
+            )
+        with self._active_lock:
+            self._active += 1
+        self._pool.submit(self._process_pooled, request, client_address)
+
+    def server_close(self):
+        super().server_close()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
 
 
 class VimeServer:
     """Persistent server that holds H5 data and responds to HTTP requests."""
 
+    COMPUTE_WAIT_MAX = 30.0  # Longest compute_status long poll, in seconds
+    FAST_TABLE_ROWS = 1000  # Default stop row for fast (raw) table reads
+    ISFILE_TTL = 0.5  # Seconds an os.path.isfile result is reused
+    ISFILE_CACHE_SIZE = 32  # Paths whose os.path.isfile result is kept
+    COLUMN_CONFIG_CACHE_SIZE = 32  # Tables whose merged column order is kept
+    RENDER_CACHE_SIZE = 32  # Rendered table previews (and info reports) kept per open file
+    TABLE_CACHE_BYTES = 512 * 1024 * 1024  # Memory budget for loaded DataFrames
+    TABLE_CACHE_SIZE = 8  # ...and at most this many of them
+
     def __init__(self):
         self.loader = DataLoader()
         self.current_df = None     # Last-fetched DataFrame
         self.current_table = None  # Name of the last-fetched table
+        self._column_map = None    # (df, {label: label}, [labels]) for _resolve_column
         self.virtual_tables = {}   # Virtual tables created by compute jobs
-        self.compute_thread = None
+        self._virtual_meta = ()    # List entries for virtual_tables, rebuilt on change
+        self._compute_pool = None      # Single reused worker for compute jobs
+        self._compute_future = None    # Future of the last submitted compute job
+        self._compute_lock = threading.RLock()    # Guards the compute_* fields below
+        self._compute_event = threading.Event()   # Set when a compute job finishes
+        # HDF5/pandas handles are not safe to share between request threads
+        self._hdf_lock = threading.RLock()
         self.compute_state = "idle"
         self.compute_message = ""
         self.compute_table_name = None
         self.compute_error = None
+        self._isfile_cache = collections.OrderedDict()  # normalized path -> (checked_at, isfile)
+        # (table_name, discovered columns) -> merged column order, LRU-bounded
+        self._column_config_cache = collections.OrderedDict()
+        self._render_cache = collections.OrderedDict()  # see _render_table
+        self._info_cache = collections.OrderedDict()  # table name -> cmd_info content
+        self._table_cache = collections.OrderedDict()  # table name -> (df, bytes), see _load_table
+        self._table_cache_bytes = 0
+        self._fast_buffers = {}  # Table name -> last fast-read array, reused by read_direct
+        # Command table, built once rather than on every dispatch
+        self._handlers = types.MappingProxyType({
+            "open": self.cmd_open,
+            "list": self.cmd_list,
+            "table": self.cmd_table,
+            "plot": self.cmd_plot,
+            "info": self.cmd_info,
+            "close": self.cmd_close,
+            "compute_start": self.cmd_compute_start,
+            "compute_status": self.cmd_compute_status,
+        })
+        # Commands that only touch compute state skip the HDF5 lock, so a
+        # status long poll never blocks table/plot requests.
+        self._lock_free = frozenset({"compute_start", "compute_status"})
         self.config = None
         try:
             self.config = Config()
@@ -91,22 +292,15 @@ class VimeServer:
         """Route a command dict to the appropriate handler."""
         cmd = payload.get("cmd", "")
         logger.info("Dispatch command: %s", cmd)
-        handlers = {
-            "open": self.cmd_open,
-            "list": self.cmd_list,
-            "table": self.cmd_table,
-            "plot": self.cmd_plot,
-            "info": self.cmd_info,
-            "close": self.cmd_close,
-            "compute_start": self.cmd_compute_start,
-            "compute_status": self.cmd_compute_status,
-        }
-        handler = handlers.get(cmd)
+        handler = self._handlers.get(cmd)
         if handler is None:
             logger.warning("Unknown command: %s", cmd)
             return {"ok": False, "error": f"Unknown command: {cmd}"}
         try:
-            return handler(payload)
+            if cmd in self._lock_free:
+                return handler(payload)
+            with self._hdf_lock:
+                return handler(payload)
         except Exception as exc:
             logger.exception("Command failed: %s", cmd)
             return {"ok": False, "error": str(exc)}
@@ -118,28 +312,68 @@ class VimeServer:
     def _close_handles(self):
         """Close any open file handles."""
         logger.info("Closing open file handles")
-        self.loader.close()
+        with self._hdf_lock:
+            self.loader.close()
+            self._render_cache.clear()
+            self._info_cache.clear()
+            self._table_cache.clear()
+            self._table_cache_bytes = 0
+            self._fast_buffers.clear()
+
+    def _shutdown_compute(self):
+        """Stop the compute worker; a running job is left to finish."""
+        with self._compute_lock:
+            if self._compute_pool is not None:
+                # A job still queued is dropped (no-op once it has started);
+                # shutdown(cancel_futures=) would need Python 3.9
+                if self._compute_future is not None:
+                    self._compute_future.cancel()
+                self._compute_pool.shutdown(wait=False)
+                self._compute_pool = None
 
     def cmd_open(self, payload):
         """Open an HDF5 file and return the list of tables."""
         filepath = payload.get("file", "")
         logger.info("Opening file: %s", filepath)
-        if not filepath or not os.path.isfile(filepath):
+        if not filepath or not self._isfile(filepath):
             logger.warning("File not found: %s", filepath)
             return {"ok": False, "error": f"File not found: {filepath}"}
 
+        # Re-opening the file that is already open keeps the live handles
+        # (and their chunk caches) instead of cycling close/open.
+        path = _normalize_path(filepath)
+        if self.loader.is_open_on(path):
+            logger.info("File already open, reusing handles: %s", filepath)
+            return {"ok": True, "tables": self._get_table_list()}
+
         self._close_handles()
         self.current_df = None
         self.current_table = None
+        self._column_map = None
 
         try:
-            self.loader.open(filepath)
+            self.loader.open(path)
         except Exception as exc:
             logger.exception("Failed to open file: %s", filepath)
             return {"ok": False, "error": str(exc)}
         logger.info("File opened: %s", filepath)
         return {"ok": True, "tables": self._get_table_list()}
 
+    def _isfile(self, path):
+        """os.path.isfile with a short-lived cache for repeated opens."""
+        key = _normalize_path(path)
+        now = time.monotonic()
+        cached = self._isfile_cache.get(key)
+        if cached is not None and now - cached[0] < self.ISFILE_TTL:
+            return cached[1]
+        result = os.path.isfile(key)
+        cache = self._isfile_cache
+        cache[key] = (now, result)
+        cache.move_to_end(key)  # kept in check order, oldest first
+        if len(cache) > self.ISFILE_CACHE_SIZE:
+            cache.popitem(last=False)
+        return result
+
     def cmd_list(self, _payload):
         """Return the list of tables in the currently open file."""
         if not self.loader.is_open:
@@ -155,47 +389,60 @@ class VimeServer:
             logger.warning("Table requested with no file open")
             return {"ok": False, "error": "No file open"}
 
-        name = payload.get("name", "")
-        head = payload.get("head", 100)
-        fast = bool(payload.get("fast", False))
+        get = payload.get
+        name = get("name", "")
+        head = get("head", 100)
+        fast = bool(get("fast", False))
         logger.info("Loading table: %s (head=%s fast=%s)", name, head, fast)
 
         if fast:
-            data = self.loader.load_table_fast(name)
+            start = get("start", 0)
+            stop = get("stop", self.FAST_TABLE_ROWS)
+            # The previous page's array is formatted and discarded before the
+            # next request, so it can be handed back as the read buffer.
+            data = self.loader.load_table_fast(
+                name, start, stop, out=self._fast_buffers.get(name)
+            )
             if data is None:
                 logger.warning("Fast table not found or unsupported: %s", name)
                 return {"ok": False, "error": f"Table not found or fast read unsupported: {name}"}
-            content = self._format_fast_table(name, data)
+            if type(data) is np.ndarray and data.base is None:
+                self._fast_buffers[name] = data
+            content = self._format_fast_table(
+                name, data, rows=self._fast_rows_note(name, start, stop)
+            )
             return {"ok": True, "content": content, "columns": [], "name": name, "fast": True}
 
-        df = self._load_table(name)
-        if df is None:
-            logger.warning("Table not found: %s", name)
-            return {"ok": False, "error": f"Table not found: {name}"}
+        # A preview only needs the first rows when the backend can read a row
+        # range; the full frame is loaded later if the table is plotted.
+        partial = None
+        if head and name not in self.virtual_tables and name not in self._table_cache:
+            partial = self.loader.load_table_head(name, head)
+        if partial is not None:
+            df, nrows = partial
+            self.current_df = None
+        else:
+            df = self._load_table(name)
+            if df is None:
+                logger.warning("Table not found: %s", name)
+                return {"ok": False, "error": f"Table not found: {name}"}
+            nrows = len(df)
 
         df = self._apply_column_config(name, df)
-        self.current_df = df
+        if partial is None:
+            self.current_df = df
         self.current_table = name
 
-        display_df = df.head(head) if head and len(df) > head else df
-
-        content = tabulate(
-            display_df,
-            headers="keys",
-            tablefmt="plain",
-            showindex=False,
-            stralign="left",
-            numalign="left",
-        )
+        content = self._render_table(name, head, df, nrows)
 
         # Add a header line with table info
-        shape_info = f"  [{len(df)} rows x {len(df.columns)} cols]"
-        if head and len(df) > head:
+        shape_info = f"  [{nrows} rows x {len(df.columns)} cols]"
+        if head and nrows > head:
             shape_info += f"  (showing first {head})"
         header = f"{name}{shape_info}"
 
         columns = [str(c) for c in df.columns]
-        logger.info("Loaded table: %s (rows=%d cols=%d)", name, len(df), len(df.columns))
+        logger.info("Loaded table: %s (rows=%d cols=%d)", name, nrows, len(df.columns))
         return {
             "ok": True,
             "content": header + "\n\n" + content,
@@ -203,16 +450,59 @@ class VimeServer:
             "name": name,
         }
 
+    def _render_table(self, name, head, df, nrows):
+        """Return the formatted head of df, reusing recent renders.
+
+        df may already be cut down to the head; nrows is the table's full
+        row count. Renders are keyed by (name, head, nrows, columns) and
+        dropped when the file is closed; compute-job tables are never cached
+        since a new job can replace them.
+        """
+        cacheable = name not in self.virtual_tables
+        if cacheable:
+            key = (name, head, nrows, tuple(df.columns))
+            content = self._render_cache.get(key)
+            if content is not None:
+                self._render_cache.move_to_end(key)
+                return content
+
+        display_df = df.head(head) if head and len(df) > head else df
+        content = self._format_table(display_df)
+        if content is None:
+            # Imported on first use: previews never need tabulate otherwise
+            from tabulate import tabulate
+
+            content = tabulate(
+                display_df,
+                headers="keys",
+                tablefmt="plain",
+                showindex=False,
+                stralign="left",
+                numalign="left",
+            )
+
+        if cacheable:
+            self._render_cache[key] = content
+            if len(self._render_cache) > self.RENDER_CACHE_SIZE:
+                self._render_cache.popitem(last=False)
+        return content
+
     def cmd_plot(self, payload):
         """Generate a braille Unicode plot from the current table."""
+        if self.current_df is None and self.current_table is not None:
+            # cmd_table only read the preview rows; load the full table now
+            df = self._load_table(self.current_table)
+            if df is not None:
+                self.current_df = self._apply_column_config(self.current_table, df)
         if self.current_df is None:
             logger.warning("Plot requested with no table loaded")
             return {"ok": False, "error": "No table loaded. Open a table first."}
 
-        cols = payload.get("cols", [])
-        plot_type = payload.get("type", "line")
-        width = payload.get("width", 72)
-        height = payload.get("height", 20)
+        get = payload.get
+        cols = get("cols", [])
+        plot_type = get("type", "line")
+        width = get("width", 72)
+        height = get("height", 20)
         logger.info("Plot request: cols=%s type=%s size=%sx%s", cols, plot_type, width, height)
 
         if len(cols) < 2:
@@ -230,20 +520,19 @@ class VimeServer:
 
         # Convert to float with error handling for non-numeric data
         try:
-            x = df[x_col].values.astype(float)
+            x = self._float_values(df[x_col])
         except (ValueError, TypeError) as exc:
             logger.warning("Non-numeric x column %s: %s", x_col, exc)
             return {"ok": False, "error": f"Cannot convert column '{x_col}' to numeric: {exc}"}
         
         try:
-            y = df[y_col].values.astype(float)
+            y = self._float_values(df[y_col])
         except (ValueError, TypeError) as exc:
             logger.warning("Non-numeric y column %s: %s", y_col, exc)
             return {"ok": False, "error": f"Cannot convert column '{y_col}' to numeric: {exc}"}
 
-        # Remove NaN pairs
-        mask = ~(np.isnan(x) | np.isnan(y))
-        x, y = x[mask], y[mask]
+        # Remove pairs with NaN/inf
+        x, y = filter_finite_pairs(x, y)
 
         if len(x) == 0:
             logger.warning("No valid data points after NaN filtering")
@@ -266,6 +555,16 @@ class VimeServer:
         name = payload.get("name", "")
         logger.info("Info requested for table: %s", name)
 
+        # A file table cannot change while its handle stays open (a re-open
+        # of a modified file goes through _close_handles), so the report is
+        # kept per name and the table is not even re-read.
+        cacheable = name not in self.virtual_tables
+        if cacheable:
+            content = self._info_cache.get(name)
+            if content is not None:
+                self._info_cache.move_to_end(name)
+                return {"ok": True, "content": content}
+
         df = self._load_table(name)
         if df is None:
             logger.warning("Info table not found: %s", name)
@@ -277,29 +576,37 @@ class VimeServer:
         lines.append("")
         lines.append("Columns:")
         lines.append("─" * 50)
-        for i, col in enumerate(df.columns):
-            dtype = df[col].dtype
-            non_null = df[col].count()
-            lines.append(f"  {i:>3}  {str(col):<30} {str(dtype):<12} ({non_null} non-null)")
+        lines.extend(
+            f"  {i:>3}  {str(col):<30} {str(dtype):<12} ({non_null} non-null)"
+            for i, (col, dtype, non_null) in enumerate(
+                zip(df.columns, df.dtypes.to_numpy(), df.count().to_numpy())
+            )
+        )
         lines.append("─" * 50)
 
         # Numeric summary
         numeric_cols = df.select_dtypes(include=[np.number]).columns
         if len(numeric_cols) > 0:
+            from tabulate import tabulate
+
             lines.append("")
             lines.append("Numeric Summary:")
-            desc = df[numeric_cols].describe().T
             lines.append(
                 tabulate(
-                    desc,
-                    headers="keys",
+                    self._numeric_summary(df, numeric_cols),
+                    headers=self.SUMMARY_HEADERS,
                     tablefmt="plain",
                     stralign="left",
                     numalign="left",
                 )
             )
 
-        return {"ok": True, "content": "\n".join(lines)}
+        content = "\n".join(lines)
+        if cacheable:
+            self._info_cache[name] = content
+            if len(self._info_cache) > self.RENDER_CACHE_SIZE:
+                self._info_cache.popitem(last=False)
+        return {"ok": True, "content": content}
 
     def cmd_close(self, _payload):
         """Close the store (HTTP shutdown handled separately)."""
@@ -309,32 +616,49 @@ class VimeServer:
 
     def cmd_compute_start(self, _payload):
         """Start a background compute job using test_compute()."""
-        if self.compute_thread is not None and self.compute_thread.is_alive():
-            logger.warning("Compute start requested while already running")
-            return {"ok": False, "error": "Compute already running", "status": "running"}
+        with self._compute_lock:
+            if self._compute_future is not None and not self._compute_future.done():
+                logger.warning("Compute start requested while already running")
+                return {"ok": False, "error": "Compute already running", "status": "running"}
+
+            self.compute_state = "running"
+            self.compute_message = "Computing..."
+            self.compute_table_name = None
+            self.compute_error = None
+            self._compute_event.clear()
 
-        self.compute_state = "running"
-        self.compute_message = "Computing..."
-        self.compute_table_name = None
-        self.compute_error = None
+            if self._compute_pool is None:
+                self._compute_pool = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="vime-compute"
+                )
+            self._compute_future = self._compute_pool.submit(self._run_compute_job)
+        logger.info("Compute job submitted")
+        return {"ok": True, "status": "running", "message": "Computing..."}
 
-        self.compute_thread = threading.Thread(
-            target=self._run_compute_job, name="vime-compute", daemon=True
-        )
-        self.compute_thread.start()
-        logger.info("Compute thread started")
-        return {"ok": True, "status": self.compute_state, "message": self.compute_message}
+    def cmd_compute_status(self, payload):
+        """Return the current compute job status.
 
-    def cmd_compute_status(self, _payload):
-        """Return the current compute job status."""
-        logger.info("Compute status requested: %s", self.compute_state)
-        return {
-            "ok": True,
-            "status": self.compute_state,
-            "message": self.compute_message,
-            "table": self.compute_table_name,
-            "error": self.compute_error,
-        }
+        An optional ``timeout`` (seconds, capped at COMPUTE_WAIT_MAX) turns
+        this into a long poll: while a job is running the request blocks
+        until it finishes or the timeout expires, instead of the client
+        re-polling.
+        """
+        timeout = payload.get("timeout")
+        if timeout and self.compute_state == "running":
+            try:
+                wait = min(max(float(timeout), 0.0), self.COMPUTE_WAIT_MAX)
+            except (TypeError, ValueError):
+                wait = 0.0
+            self._compute_event.wait(wait)
+        with self._compute_lock:
+            logger.info("Compute status requested: %s", self.compute_state)
+            return {
+                "ok": True,
+                "status": self.compute_state,
+                "message": self.compute_message,
+                "table": self.compute_table_name,
+                "error": self.compute_error,
+            }
 
     # ------------------------------------------------------------------
     # Helpers
@@ -349,56 +673,288 @@ class VimeServer:
         if name in self.virtual_tables:
             logger.info("Loading virtual table: %s", name)
             return self.virtual_tables[name]["df"]
+        cache = self._table_cache
+        entry = cache.get(name)
+        if entry is not None:
+            cache.move_to_end(name)
+            logger.info("Using cached table: %s", name)
+            return entry[0]
         logger.info("Loading table from store: %s", name)
-        return self.loader.load_table(name)
+        df = self.loader.load_table(name)
+        if df is None:
+            return None
+        size = int(df.memory_usage(index=True, deep=True).sum())
+        if size <= self.TABLE_CACHE_BYTES:
+            cache[name] = (df, size)
+            self._table_cache_bytes += size
+            while (self._table_cache_bytes > self.TABLE_CACHE_BYTES
+                   or len(cache) > self.TABLE_CACHE_SIZE):
+                _, (_, evicted) = cache.popitem(last=False)
+                self._table_cache_bytes -= evicted
+        return df
+
+    SUMMARY_HEADERS = ["", "count", "mean", "std", "min", "25%", "50%", "75%", "max"]
+
+    @staticmethod
+    def _numeric_summary(df, numeric_cols):
+        """Return describe()-style rows computed with NaN-aware NumPy reductions.
+
+        Works on one float64 block instead of per-column pandas Series, and
+        skips building the intermediate describe() DataFrame.
+        """
+        mat = df[numeric_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+        if mat.shape[0] == 0:
+            return [[col, 0] + [np.nan] * 7 for col in numeric_cols]
+        count = np.count_nonzero(~np.isnan(mat), axis=0)
+        with warnings.catch_warnings():
+            # All-NaN (or single-value) columns yield NaN, as describe() does
+            warnings.simplefilter("ignore", RuntimeWarning)
+            mean = np.nanmean(mat, axis=0)
+            std = np.nanstd(mat, axis=0, ddof=1)
+            mn = np.nanmin(mat, axis=0)
+            q25, q50, q75 = np.nanquantile(mat, [0.25, 0.5, 0.75], axis=0)
+            mx = np.nanmax(mat, axis=0)
+        stats = np.column_stack([count, mean, std, mn, q25, q50, q75, mx])
+        return [[col] + row for col, row in zip(numeric_cols, stats.tolist())]
 
     def _apply_column_config(self, table_name, df):
         """Apply configured column order/visibility for a table."""
         if self.config is None:
             return df
 
-        discovered = [str(col) for col in df.columns]
-        try:
-            configured = self.config.merge_table_columns(table_name, discovered)
-        except Exception as exc:
-            logger.warning("Failed to sync table config for %s: %s", table_name, exc)
+        discovered = tuple(str(col) for col in df.columns)
+        key = (table_name, discovered)
+        cache = self._column_config_cache
+        configured = cache.get(key)
+        if configured is not None:
+            cache.move_to_end(key)
+        else:
+            try:
+                configured = self.config.merge_table_columns(table_name, list(discovered))
+            except Exception as exc:
+                logger.warning("Failed to sync table config for %s: %s", table_name, exc)
+                return df
+            cache[key] = configured
+            if len(cache) > self.COLUMN_CONFIG_CACHE_SIZE:
+                cache.popitem(last=False)
+
+        if not df.columns.is_unique:
+            col_map = {str(col): col for col in df.columns}
+            ordered_actual = [col_map[col] for col in configured if col in col_map]
+            return df.loc[:, ordered_actual] if ordered_actual else df
+
+        # Reorder by integer position; an unchanged order returns df as-is
+        pos_map = {str(col): i for i, col in enumerate(df.columns)}
+        positions = [pos_map[col] for col in configured if col in pos_map]
+        if not positions or positions == list(range(len(df.columns))):
             return df
-
-        col_map = {str(col): col for col in df.columns}
-        ordered_actual = [col_map[col] for col in configured if col in col_map]
-        if not ordered_actual:
-            return df
-        return df.loc[:, ordered_actual]
+        return df.iloc[:, positions]
 
     def _get_table_list(self):
         """Return a list of dicts with table metadata."""
-        tables = list(self.loader.list_tables())
-        if self.virtual_tables:
-            logger.info("Adding %d virtual tables", len(self.virtual_tables))
-            tables.extend(
-                {
-                    "name": entry["name"],
-                    "rows": entry["rows"],
-                    "cols": entry["cols"],
-                }
-                for entry in self.virtual_tables.values()
-            )
+        # list_tables() already hands back a fresh list from its
+        # (filepath, mtime) cache, so it can be extended in place.
+        tables = self.loader.list_tables()
+        virtual = self._virtual_meta
+        if virtual:
+            logger.info("Adding %d virtual tables", len(virtual))
+            tables.extend(virtual)
         return tables
 
     @staticmethod
-    def _format_fast_table(name, data):
-        """Return a fast, raw string representation of table data."""
+    def _format_cells(series):
+        """Return the display strings of one column as a NumPy str array.
+
+        Returns None when tabulate would print the column differently than
+        this can: cells spanning several lines, non-ASCII text (tabulate
+        pads by display width), and object columns whose values are all
+        numbers or numeric strings (tabulate reformats those as numbers).
+        """
+        dtype = series.dtype
+        kind = dtype.kind if isinstance(dtype, np.dtype) else "O"
+        if kind == "f":
+            return np.char.mod("%g", series.to_numpy())
+        if kind in "iu":
+            return series.to_numpy().astype(str)
+        if kind == "b":
+            return np.where(series.to_numpy(), "True", "False")
+        cells = []
+        has_text = False
+        for val in series.astype(object).tolist():
+            if val is None:
+                cells.append("")
+                continue
+            if isinstance(val, bytes):
+                try:
+                    text = val.decode("ascii")
+                except UnicodeDecodeError:
+                    text = str(val)
+            elif isinstance(val, (float, np.floating)) and val != val:
+                cells.append("nan")  # missing values don't decide the column type
+                continue
+            else:
+                text = str(val)
+            if not has_text and text and (isinstance(val, bool) or not _is_number(val)):
+                has_text = True  # empty strings count as missing, like None
+            if "\n" in text:
+                return None
+            # tabulate strips surrounding whitespace from text cells
+            cells.append(text.strip())
+        if not has_text:
+            return None
+        try:
+            "".join(cells).encode("ascii")
+        except UnicodeEncodeError:
+            return None
+        return np.array(cells, dtype=str)
+
+    @classmethod
+    def _format_table(cls, df):
+        """Render df as a left-aligned plain text table, one column at a time.
+
+        Output is what tabulate(df, tablefmt="plain") prints (header padded
+        by two, two-space gutters, trailing blanks stripped), with values
+        seen as tabulate sees them through ``df.values``: all-numeric frames
+        of mixed dtypes are upcast to their common dtype first (ints in a
+        float table print as floats). Returns None for anything whose
+        formatting is not reproduced here (empty frames, frames that are all
+        bool, datetime or timedelta, and the columns _format_cells rejects),
+        so the caller can fall back to tabulate.
+        """
+        if len(df) == 0 or len(df.columns) == 0:
+            return None
+        # df is only the preview rows, so probing the common dtype is cheap
+        common = df.to_numpy().dtype
+        if common == object:
+            common = None
+        elif common.kind in "bmM":
+            return None
+        labels = [str(col) for col in df.columns]
+        try:
+            "".join(labels).encode("ascii")
+        except UnicodeEncodeError:
+            return None
+        columns = []
+        for i in range(len(df.columns)):
+            col = df.iloc[:, i]
+            if common is not None and col.dtype != common:
+                col = col.astype(common)
+            cells = cls._format_cells(col)
+            if cells is None:
+                return None
+            columns.append(cells)
+        return cls._layout_columns(labels, columns, header_pad=2)
+
+    @staticmethod
+    def _layout_columns(labels, columns, header_pad=0):
+        """Join per-column str arrays into left-aligned lines under a header.
+
+        Each column is as wide as its widest cell or its label plus
+        header_pad; columns are separated by two spaces and trailing
+        blanks are stripped from every line.
+        """
+        headers = []
+        body = None
+        for label, cells in zip(labels, columns):
+            width = len(label) + header_pad
+            if len(cells):
+                width = max(width, int(np.char.str_len(cells).max()))
+            headers.append(label.ljust(width))
+            cells = np.char.ljust(cells, width)
+            body = cells if body is None else np.char.add(np.char.add(body, "  "), cells)
+        lines = ["  ".join(headers).rstrip()]
+        lines.extend(line.rstrip() for line in body.tolist())
+        return "\n".join(lines)
+
+    @staticmethod
+    def _format_struct_rows(arr):
+        """Format a 1-D structured array field by field (one column per field).
+
+        Each field is a strided view formatted with one vectorized call, so
+        records are never walked one at a time. Sub-array fields expand to
+        ``name[i]`` columns.
+        """
+        labels = []
+        columns = []
+        for field in arr.dtype.names:
+            values = arr[field]
+            if values.ndim == 1:
+                parts = [(field, values)]
+            else:
+                flat = values.reshape(len(values), -1)
+                parts = [(f"{field}[{i}]", flat[:, i]) for i in range(flat.shape[1])]
+            for label, col in parts:
+                kind = col.dtype.kind
+                if kind == "f":
+                    cells = np.char.mod("%g", col)
+                elif kind in "biuU":
+                    cells = col.astype(str)
+                elif kind == "S":
+                    cells = np.char.decode(col, "ascii", "replace")
+                else:
+                    cells = np.array([str(v) for v in col.tolist()], dtype=str)
+                labels.append(label)
+                columns.append(cells)
+        return VimeServer._layout_columns(labels, columns)
+
+    FAST_TABLE_CHUNK_ROWS = 4096  # Rows handed to np.savetxt per call
+    FAST_TABLE_MAX_ELEMENTS = 1_000_000  # array2string summarizes beyond this
+
+    def _fast_rows_note(self, name, start, stop):
+        """Return (total_rows, shown_range) for a fast read, or None if unknown.
+
+        The row count comes from the cached table list, so the header can
+        show the whole table's shape and which slice of it is printed.
+        """
+        for table in self._get_table_list():
+            if table.get("name") == name:
+                total = table.get("rows")
+                if not isinstance(total, int):
+                    return None
+                try:
+                    return total, range(total)[start:stop]
+                except TypeError:
+                    return None
+        return None
+
+    @classmethod
+    def _format_fast_table(cls, name, data, rows=None):
+        """Return a fast, raw string representation of table data.
+
+        Plain 1-D/2-D numeric arrays are written row by row with np.savetxt
+        in bounded chunks; anything else goes through np.array2string.
+        ``rows`` is ``(total_rows, shown_range)`` from _fast_rows_note; when
+        given, the header shows the full table shape and notes a partial read.
+        """
         try:
             shape = getattr(data, "shape", None)
+            note = ""
+            if rows is not None and shape:
+                total, shown = rows
+                shape = (total,) + tuple(shape[1:])
+                if len(shown) < total:
+                    note = f"  (showing rows {shown.start}-{shown.stop} of {total})"
             shape_info = f"  {shape}" if shape is not None else ""
-            size = int(np.size(data))
             arr = np.asarray(data)
+            if arr.dtype.kind in "biuf" and 1 <= arr.ndim <= 2:
+                buf = io.StringIO()
+                buf.write(f"{name}{shape_info}  [fast]{note}\n\n")
+                fmt = "%.6g" if arr.dtype.kind == "f" else "%d"
+                step = cls.FAST_TABLE_CHUNK_ROWS
+                savetxt = np.savetxt
+                for start in range(0, arr.shape[0], step):
+                    savetxt(buf, arr[start:start + step], fmt=fmt)
+                return buf.getvalue().rstrip("\n")
+            if arr.dtype.names is not None and arr.ndim == 1:
+                body = cls._format_struct_rows(arr)
+                return f"{name}{shape_info}  [fast]{note}\n\n{body}"
+            size = min(int(arr.size), cls.FAST_TABLE_MAX_ELEMENTS)
             body = np.array2string(
                 arr,
                 threshold=size if size > 0 else 1,
                 max_line_width=200,
             )
-            return f"{name}{shape_info}  [fast]\n\n{body}"
+            return f"{name}{shape_info}  [fast]{note}\n\n{body}"
         except Exception:
             return f"{name}  [fast]\n\n{str(data)}"
 
@@ -417,39 +973,68 @@ class VimeServer:
         try:
             logger.info("Compute job started")
             df = test_compute()
-            name = self._new_compute_name()
-            self.virtual_tables[name] = {
-                "name": name,
-                "df": df,
-                "rows": int(df.shape[0]),
-                "cols": int(df.shape[1]),
-            }
-            self.compute_table_name = name
-            self.compute_state = "done"
-            self.compute_message = f"Compute done: {name}"
-            self.compute_error = None
+            with self._compute_lock:
+                name = self._new_compute_name()
+                self.virtual_tables[name] = {
+                    "name": name,
+                    "df": df,
+                    "rows": int(df.shape[0]),
+                    "cols": int(df.shape[1]),
+                }
+                self._virtual_meta = tuple(
+                    {"name": entry["name"], "rows": entry["rows"], "cols": entry["cols"]}
+                    for entry in self.virtual_tables.values()
+                )
+                self.compute_table_name = name
+                self.compute_state = "done"
+                self.compute_message = f"Compute done: {name}"
+                self.compute_error = None
             logger.info("Compute job completed: %s", name)
         except Exception as exc:
-            self.compute_state = "error"
-            self.compute_message = "Compute failed"
-            self.compute_error = str(exc)
+            with self._compute_lock:
+                self.compute_state = "error"
+                self.compute_message = "Compute failed"
+                self.compute_error = str(exc)
             logger.exception("Compute job failed")
+        finally:
+            self._compute_event.set()
 
     @staticmethod
-    def _resolve_column(df, ref):
-        """Resolve a column reference (int index or string name)."""
+    def _float_values(series):
+        """Return a column as a float64 ndarray, without copying float64 data.
+
+        Extension dtypes (nullable ints, categoricals, strings) convert in a
+        single to_numpy call with missing values mapped to NaN.
+        """
+        if isinstance(series.dtype, np.dtype):
+            return series.to_numpy().astype(np.float64, copy=False)
+        return series.to_numpy(dtype=np.float64, na_value=np.nan)
+
+    def _resolve_column(self, df, ref):
+        """Resolve a column reference (int index or string name).
+
+        Label and position lookups come from a map built once per
+        DataFrame, so repeated plots on the same table skip Index scans.
+        """
+        cached = self._column_map
+        if cached is None or cached[0] is not df:
+            cached = (df, {col: col for col in df.columns}, list(df.columns))
+            self._column_map = cached
+        _, names, positions = cached
         if isinstance(ref, int):
-            if ref < 0 or ref >= len(df.columns):
-                raise IndexError(f"Column index {ref} out of range (0-{len(df.columns)-1})")
-            return df.columns[ref]
+            if ref < 0 or ref >= len(positions):
+                raise IndexError(f"Column index {ref} out of range (0-{len(positions)-1})")
+            return positions[ref]
         # Try as string name
-        if ref in df.columns:
-            return ref
+        try:
+            return names[ref]
+        except (KeyError, TypeError):
+            pass
         # Try parsing as int
         try:
             idx = int(ref)
-            if 0 <= idx < len(df.columns):
-                return df.columns[idx]
+            if 0 <= idx < len(positions):
+                return positions[idx]
         except (ValueError, TypeError):
             pass
         raise KeyError(ref)
@@ -466,58 +1051,178 @@ def _parse_request_json(handler):
     length = int(handler.headers.get("Content-Length", "0") or "0")
     if length <= 0:
         return {}
-    raw = handler.rfile.read(length).decode("utf-8")
+    raw = handler.rfile.read(length)
     if not raw:
         return {}
     try:
-        payload = json.loads(raw)
-    except json.JSONDecodeError:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        payload = orjson.loads(raw) if orjson is not None else json.loads(raw.decode("utf-8"))
+    except (json.JSONDecodeError, UnicodeDecodeError):
         return None
     return payload if isinstance(payload, dict) else None
 
 
+KEEPALIVE_TIMEOUT = 1.0  # Seconds an idle keep-alive connection stays open
+SENDMSG_MAX_BUFFERS = 512  # Stay well under the platform IOV_MAX
+GZIP_MIN_BYTES = 1024  # Smaller responses are sent uncompressed
+GZIP_LEVEL = 1  # Fastest level; table and braille text still shrinks ~10x
+
+
+def _gzip_chunks(chunks):
+    """Gzip-compress a list of byte chunks into a new list of chunks."""
+    compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)  # wbits 31 = gzip container
+    out = [compressor.compress(chunk) for chunk in chunks]
+    out.append(compressor.flush())
+    return [part for part in out if part]
+
+
+def _send_buffers(sock, wfile, buffers):
+    """Write buffers to a socket with sendmsg (writev), handling short writes.
+
+    Falls back to one wfile.write per buffer where sendmsg is unavailable.
+    """
+    if not hasattr(sock, "sendmsg"):
+        for buf in buffers:
+            wfile.write(buf)
+        return
+    views = [memoryview(buf) for buf in buffers if len(buf)]
+    while views:
+        sent = sock.sendmsg(views[:SENDMSG_MAX_BUFFERS])
+        while sent:
+            size = len(views[0])
+            if sent >= size:
+                sent -= size
+                views.pop(0)
+            else:
+                views[0] = views[0][sent:]
+                sent = 0
+
+
+# POST route -> command name, built once at import
+ROUTES = types.MappingProxyType({
+    "/open": "open",
+    "/list": "list",
+    "/table": "table",
+    "/plot": "plot",
+    "/info": "info",
+    "/compute_start": "compute_start",
+    "/compute_status": "compute_status",
+    "/close": "close",
+})
+
+# Routes that reply with the command's "content" as plain text instead of
+# JSON, skipping the escape pass over large table/plot strings
+RAW_ROUTES = types.MappingProxyType({
+    "/table_raw": "table",
+    "/plot_raw": "plot",
+})
+RAW_CHUNK_CHARS = 64 * 1024
+
+
 def make_handler(vime_server):
     class VimeHandler(BaseHTTPRequestHandler):
         server_version = "VIMEHTTP/1.0"
+        # Keep-alive: one connection can carry many requests (e.g. status
+        # polls). Each open connection holds a pooled worker, so idle ones
+        # time out quickly and none are kept once the pool is full; that
+        # leaves room for /health and /shutdown.
+        protocol_version = "HTTP/1.1"
+
+        def handle_one_request(self):
+            # The short timeout covers only the wait for the next request
+            # line; reading the body and writing the reply stay blocking.
+            self.connection.settimeout(KEEPALIVE_TIMEOUT)
+            try:
+                self.rfile.peek(1)
+            except TimeoutError:
+                self.close_connection = True
+                return
+            self.connection.settimeout(self.timeout)
+            super().handle_one_request()
 
         def _send_json(self, status_code, payload):
-            body = json.dumps(payload, cls=NumpyEncoder).encode("utf-8")
+            content_type = "application/json; charset=utf-8"
+            if msgpack is not None and MSGPACK_MEDIA_TYPE in self.headers.get("Accept", ""):
+                content_type = MSGPACK_MEDIA_TYPE
+                chunks = [msgpack.packb(payload, default=_msgpack_default, use_bin_type=True)]
+            else:
+                chunks = encode_response(payload)
+            gzip_ok = "gzip" in self.headers.get("Accept-Encoding", "").lower()
+            if gzip_ok and sum(map(len, chunks)) > GZIP_MIN_BYTES:
+                chunks = _gzip_chunks(chunks)
+            else:
+                gzip_ok = False
+            if not self.server.keepalive_allowed():
+                self.close_connection = True
+            # The status line and headers send_response/send_header would
+            # write, built here so they leave with the body in one gather
+            # write.
+            self.log_request(status_code)
+            lines = [
+                f"{self.protocol_version} {status_code} {self.responses[status_code][0]}",
+                f"Server: {self.version_string()}",
+                f"Date: {self.date_time_string()}",
+                f"Content-Type: {content_type}",
+            ]
+            if gzip_ok:
+                lines.append("Content-Encoding: gzip")
+            lines.append(f"Content-Length: {sum(map(len, chunks))}")
+            lines.append("Connection: " + ("close" if self.close_connection else "keep-alive"))
+            head = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+            _send_buffers(self.connection, self.wfile, [head] + chunks)
+
+        def _route_to_cmd(self, path):
+            return ROUTES.get(path)
+
+        def _send_text(self, status_code, text):
+            # Sent with chunked transfer encoding so the body can be encoded
+            # and written slice by slice while the connection stays open.
+            # HTTP/1.0 clients cannot read chunks; their body ends when the
+            # connection closes instead.
+            chunked = self.request_version != "HTTP/1.0"
+            if not chunked or not self.server.keepalive_allowed():
+                self.close_connection = True
             self.send_response(status_code)
-            self.send_header("Content-Type", "application/json")
-            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Content-Type", "text/plain; charset=utf-8")
+            if chunked:
+                self.send_header("Transfer-Encoding", "chunked")
+            self.send_header("Connection", "close" if self.close_connection else "keep-alive")
             self.end_headers()
-            self.wfile.write(body)
+            for start in range(0, len(text), RAW_CHUNK_CHARS):
+                data = text[start:start + RAW_CHUNK_CHARS].encode("utf-8")
+                if chunked:
+                    data = b"%x\r\n%b\r\n" % (len(data), data)
+                self.wfile.write(data)
+            if chunked:
+                self.wfile.write(b"0\r\n\r\n")
 
-        def _route_to_cmd(self, path):
-            routes = {
-                "/open": "open",
-                "/list": "list",
-                "/table": "table",
-                "/plot": "plot",
-                "/info": "info",
-                "/compute_start": "compute_start",
-                "/compute_status": "compute_status",
-                "/close": "close",
-                }
-            return routes.get(path)
         def do_GET(self):
-            parsed = urlparse(self.path)
-            if parsed.path == "/health":
+            has_body = self.headers.get("Content-Length", "0") not in ("", "0")
+            if has_body or "Transfer-Encoding" in self.headers:
+                # GET bodies are never read, so the connection cannot be reused
+                self.close_connection = True
+            path = self.path.partition("?")[0]
+            if path == "/health":
                 self._send_json(200, {"ok": True})
                 return
             self._send_json(404, {"ok": False, "error": "Not found"})
 
         def do_POST(self):
-            parsed = urlparse(self.path)
-            if parsed.path == "/shutdown":
+            path = self.path.partition("?")[0]
+            if path == "/shutdown":
                 logger.info("Shutdown requested via HTTP")
                 vime_server._close_handles()
+                vime_server._shutdown_compute()
+                self.close_connection = True
                 self._send_json(200, {"ok": True})
                 threading.Thread(target=self.server.shutdown, daemon=True).start()
                 return
 
-            cmd = self._route_to_cmd(parsed.path)
+            raw_cmd = RAW_ROUTES.get(path)
+            cmd = raw_cmd or self._route_to_cmd(path)
             if cmd is None:
+                # The request body is left unread, so the connection cannot be reused
+                self.close_connection = True
                 self._send_json(404, {"ok": False, "error": "Unknown route"})
                 return
 
@@ -528,28 +1233,45 @@ def make_handler(vime_server):
 
             payload["cmd"] = cmd
             response = vime_server.dispatch(payload)
+            if raw_cmd is not None and response.get("ok"):
+                self._send_text(200, response.get("content", ""))
+                return
             self._send_json(200, response)
 
         def log_message(self, fmt, *args):
-            logger.info("%s - %s", self.address_string(), fmt % args)
+            # Called for every request; skip the eager fmt % args when the
+            # access log would be dropped anyway.
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("%s - %s", self.address_string(), fmt % args)
 
     return VimeHandler
 
 
 def _bind_http_server(host, start_port, max_attempts, handler_cls):
-    """Bind HTTP server with incremental port fallback."""
+    """Bind HTTP server with incremental port fallback.
+
+    One server (and socket) is created up front; only the bind is retried
+    on each candidate port.
+    """
     attempts = max(1, int(max_attempts))
+    win_addr_in_use = getattr(errno, "WSAEADDRINUSE", 10048)
+    httpd = VimeHTTPServer((host, start_port), handler_cls, bind_and_activate=False)
     for offset in range(attempts):
         port = start_port + offset
+        httpd.server_address = (host, port)
         try:
-            return VimeHTTPServer((host, port), handler_cls), port
+            httpd.server_bind()
+            httpd.server_activate()
+            return httpd, port
         except OSError as exc:
-            win_addr_in_use = getattr(errno, "WSAEADDRINUSE", 10048)
             if exc.errno in (errno.EADDRINUSE, win_addr_in_use):
                 logger.info("Port %s already in use, trying %s", port, port + 1)
                 continue
+            httpd.server_close()
             raise
 
+    httpd.server_close()
+
     end_port = start_port + attempts - 1
     raise RuntimeError(
         f"No open port found for {host} in range {start_port}-{end_port}"
@@ -567,6 +1289,12 @@ def main():
         default=int(os.environ.get("VIME_HTTP_PORT_RETRIES", "100")),
         help="Maximum number of incremental ports to try, starting from --port",
     )
+    parser.add_argument(
+        "--ready-fd",
+        type=int,
+        default=None,
+        help="Inherited file descriptor to write the bound port to once listening (then closed)",
+    )
     args = parser.parse_args()
 
     vime = VimeServer()
@@ -579,12 +1307,20 @@ def main():
         sys.exit(1)
 
     logger.info("VIME HTTP server listening on %s:%s", args.host, bound_port)
+    if args.ready_fd is not None:
+        # Lets a launcher wait on one read instead of polling /health
+        try:
+            os.write(args.ready_fd, f"{bound_port}\n".encode("ascii"))
+            os.close(args.ready_fd)
+        except OSError as exc:
+            logger.warning("Could not signal readiness on fd %s: %s", args.ready_fd, exc)
     try:
         httpd.serve_forever()
     except KeyboardInterrupt:
         logger.info("HTTP server interrupted, shutting down")
     finally:
         vime._close_handles()
+        vime._shutdown_compute()
         httpd.server_close()
         logger.info('goodbye!')
 
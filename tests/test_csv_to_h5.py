@@ -0,0 +1,72 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "utils"))
+
+import csv_to_h5  # noqa: E402
+
+
+def _write_growing_csv(path, rows=1500, switch=1000):
+    ids = np.arange(rows)
+    df = pd.DataFrame({
+        "id": ids,
+        # one-character strings, then much longer ones after the first chunk
+        "name": np.where(ids < switch, "x", "a much longer name"),
+        # int in the first chunk, NaN later turns it into a float column
+        "count": pd.array(np.where(ids < switch, ids, np.nan)),
+        # numbers first, text later
+        "code": np.where(ids < switch, ids.astype(str), "code-" + ids.astype(str)),
+        "value": np.linspace(0.0, 1.0, rows),
+    })
+    df.loc[switch + 7, "count"] = 3
+    df.to_csv(path, index=False)
+
+
+def test_chunked_matches_full_read_when_later_chunks_widen(tmp_path, monkeypatch):
+    csv_path = tmp_path / "growing.csv"
+    _write_growing_csv(csv_path)
+    monkeypatch.setattr(csv_to_h5, "CHUNK_ROWS", 1000)
+
+    chunked = tmp_path / "chunked.h5"
+    full = tmp_path / "full.h5"
+    csv_to_h5.csv_to_h5([str(csv_path)], str(chunked), chunked=True)
+    csv_to_h5.csv_to_h5([str(csv_path)], str(full))
+
+    got = pd.read_hdf(chunked, "growing")
+    want = pd.read_hdf(full, "growing")
+    pd.testing.assert_frame_equal(got, want)
+    assert got["name"].iloc[-1] == "a much longer name"
+    assert got["count"].dtype == np.float64
+
+
+def test_scan_csv_pins_types_across_chunks(tmp_path, monkeypatch):
+    csv_path = tmp_path / "growing.csv"
+    _write_growing_csv(csv_path)
+    monkeypatch.setattr(csv_to_h5, "CHUNK_ROWS", 1000)
+
+    dtypes, min_itemsize = csv_to_h5.scan_csv(csv_path)
+    assert dtypes["id"] == "int64"
+    assert dtypes["count"] == "float64"
+    assert dtypes["name"] is str
+    assert dtypes["code"] is str
+    assert min_itemsize["name"] == len("a much longer name")
+
+
+def test_pyarrow_read_matches_pandas(tmp_path):
+    pytest.importorskip("pyarrow")
+    csv_path = tmp_path / "mixed.csv"
+    csv_path.write_text(
+        "id,day,ts,name,pad,num,flag\n"
+        "1,2024-01-01,2024-01-01 10:00:00,NA,  left,  5,True\n"
+        "2,2024-01-02,2024-01-02 11:30:00,null,right  ,6 ,False\n"
+        "3,2024-01-03,,bob, mid ,,True\n"
+    )
+    pd.testing.assert_frame_equal(csv_to_h5.read_csv(csv_path), pd.read_csv(csv_path))
+
+    h5_path = tmp_path / "mixed.h5"
+    csv_to_h5.csv_to_h5([str(csv_path)], str(h5_path))
+    pd.testing.assert_frame_equal(pd.read_hdf(h5_path, "mixed"), pd.read_csv(csv_path))
@@ -0,0 +1,45 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "python"))
+
+import plotter  # noqa: E402
+from plotter import BRAILLE_LUT, BrailleCanvas, _draw_lines  # noqa: E402
+
+
+def _bresenham_cells(canvas, px, py):
+    cells = np.zeros_like(canvas._cells)
+    _draw_lines(cells, px.astype(np.intp), py.astype(np.intp),
+                canvas.pixel_width - 1, canvas.pixel_height - 1, BRAILLE_LUT)
+    return cells
+
+
+def test_lines_matches_bresenham():
+    rng = np.random.default_rng(0)
+    for _ in range(50):
+        canvas = BrailleCanvas(40, 10)
+        n = rng.integers(2, 200)
+        px = rng.integers(0, canvas.pixel_width, n)
+        py = rng.integers(0, canvas.pixel_height, n)
+        canvas.lines(px, py)
+        np.testing.assert_array_equal(canvas._cells, _bresenham_cells(canvas, px, py))
+
+
+def test_decimation_keeps_line_pixels():
+    rng = np.random.default_rng(1)
+    canvas = BrailleCanvas(40, 10)
+    for _ in range(50):
+        n = rng.integers(2, 5000)
+        x = np.sort(rng.random(n))
+        px = np.rint(x * (canvas.pixel_width - 1)).astype(np.intp)
+        py = rng.integers(0, canvas.pixel_height, n)
+        want = _bresenham_cells(canvas, px, py)
+
+        dx, dy = plotter._decimate_columns(px, py)
+        np.testing.assert_array_equal(_bresenham_cells(canvas, dx, dy), want)
+
+        order = rng.permutation(n)
+        ux, uy = plotter._decimate_unsorted(x[order], px[order], py[order])
+        np.testing.assert_array_equal(_bresenham_cells(canvas, ux, uy), want)
@@ -5,13 +5,120 @@ Table names are derived from CSV filenames (without extension).
 """
 
 import argparse
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-import pandas as pd
+# pandas and pyarrow are imported where they are used, so --help and argument
+# errors don't pay their import time.
 
 
-def csv_to_h5(csv_paths, h5_path, directory=None):
+# pd.read_csv's default na_values, so pyarrow turns the same cells into NaN
+PANDAS_NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a",
+    "nan", "null",
+]
+
+
+def read_csv(path):
+    """Read a CSV into a DataFrame, with pyarrow's multi-threaded parser if available.
+
+    The pyarrow read is set up to store what pd.read_csv would: the same
+    null markers, and date/time columns kept as the strings in the file
+    (pandas does not parse dates unless asked). Files pyarrow rejects are
+    read with pandas.
+    """
+    import pandas as pd
+
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+    except ImportError:  # optional: falls back to pandas' own CSV parser
+        pacsv = None
+
+    if pacsv is None:
+        return pd.read_csv(path)
+    read_options = pacsv.ReadOptions(use_threads=True, block_size=16 << 20)
+
+    def convert_options(column_types=None):
+        return pacsv.ConvertOptions(
+            null_values=PANDAS_NA_VALUES,
+            strings_can_be_null=True,
+            column_types=column_types,
+        )
+
+    try:
+        table = pacsv.read_csv(path, read_options=read_options,
+                               convert_options=convert_options())
+        temporal = {f.name: pa.string() for f in table.schema if pa.types.is_temporal(f.type)}
+        if temporal:
+            # Re-read just to keep those columns as text
+            table = pacsv.read_csv(path, read_options=read_options,
+                                   convert_options=convert_options(temporal))
+    except pa.ArrowInvalid:
+        return pd.read_csv(path)
+    # self_destruct frees Arrow buffers as columns are converted
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+
+CHUNK_ROWS = 100_000
+
+
+def scan_csv(path):
+    """
+    Work out one dtype per column, and string widths, over every chunk of a CSV.
+
+    An appended table takes its column types and string sizes from the first
+    chunk it sees, so a longer string or a NaN in an int column further down
+    would not fit. Scanning first lets every chunk be parsed the same way.
+    """
+    import pandas as pd
+
+    kinds = {}
+    widths = {}
+    for chunk in pd.read_csv(path, chunksize=CHUNK_ROWS, low_memory=False):
+        for col, s in chunk.items():
+            kinds.setdefault(col, set()).add(s.dtype.kind)
+            width = s.dropna().astype(str).str.len().max()
+            if pd.notna(width):
+                widths[col] = max(widths.get(col, 0), int(width))
+
+    dtypes = {}
+    for col, seen in kinds.items():
+        if seen <= {"i"}:
+            dtypes[col] = "int64"
+        elif seen <= {"u"}:
+            dtypes[col] = "uint64"
+        elif seen <= {"i", "u", "f"}:
+            dtypes[col] = "float64"
+        elif seen == {"b"}:
+            dtypes[col] = "bool"
+        else:
+            dtypes[col] = str
+    # at least 3 so NaN fits as PyTables' "nan" placeholder
+    min_itemsize = {
+        col: max(widths.get(col, 0), 3) for col, dtype in dtypes.items() if dtype is str
+    }
+    return dtypes, min_itemsize
+
+
+def append_csv(store, key, path):
+    """Append a CSV to a table in chunks, with column types pinned by scan_csv."""
+    import pandas as pd
+
+    dtypes, min_itemsize = scan_csv(path)
+    rows = 0
+    for chunk in pd.read_csv(path, chunksize=CHUNK_ROWS, low_memory=False, dtype=dtypes):
+        # keep one running row index across chunks, as a full read would
+        chunk.index = pd.RangeIndex(rows, rows + len(chunk))
+        store.append(key, chunk, format="table", index=False, min_itemsize=min_itemsize)
+        rows += len(chunk)
+    return rows
+
+
+def csv_to_h5(csv_paths, h5_path, directory=None, fixed=False, chunked=False):
     """
     Write one HDF5 table per CSV file. Filename (stem) = table name.
 
@@ -19,6 +126,11 @@ def csv_to_h5(csv_paths, h5_path, directory=None):
         csv_paths: List of paths to CSV files (or basenames if directory is set).
         h5_path: Path of the output .h5 file.
         directory: If set, csv_paths are joined with this directory.
+        fixed: Write pandas "fixed" format (faster to write, no row queries)
+            instead of "table".
+        chunked: Read each CSV in chunks and append them, so memory is bounded
+            by one chunk rather than the file. Each file is scanned once first
+            to fix column types and string widths. Not compatible with fixed.
     """
     if directory is not None:
         directory = Path(directory)
@@ -33,13 +145,53 @@ def csv_to_h5(csv_paths, h5_path, directory=None):
             print(f"  {p}", file=sys.stderr)
         sys.exit(1)
 
+    import pandas as pd
+
     h5_path = Path(h5_path)
-    with pd.HDFStore(str(h5_path), mode="w") as store:
-        for path in resolved:
-            name = path.stem
-            df = pd.read_csv(path)
-            store.put(f"/{name}", df, format="table")
-            print(f"  {name}: {len(df)} rows")
+    fmt = "fixed" if fixed else "table"
+    if chunked:
+        with pd.HDFStore(str(h5_path), mode="w") as store:
+            for path in resolved:
+                name = path.stem
+                try:
+                    rows = append_csv(store, f"/{name}", path)
+                except ValueError as exc:
+                    # Widths of columns that parsed as numbers in some chunks
+                    # are estimated from the parsed values and can fall short.
+                    print(f"  {name}: chunked append failed ({exc}); reading whole file",
+                          file=sys.stderr)
+                    if f"/{name}" in store:
+                        store.remove(f"/{name}")
+                    df = read_csv(path)
+                    store.put(f"/{name}", df, format="table", index=False)
+                    rows = len(df)
+                print(f"  {name}: {rows} rows")
+        print(f"Wrote {len(resolved)} tables to {h5_path}")
+        return
+
+    # CSV parsing is CPU-bound, so several files are parsed in worker
+    # processes; HDF5 allows one writer, so results are stored here in order.
+    pool = None
+    futures = []
+    if len(resolved) > 1:
+        pool = ProcessPoolExecutor(max_workers=min(len(resolved), os.cpu_count() or 1))
+        futures = [pool.submit(read_csv, p) for p in resolved]
+    try:
+        frames = (f.result() for f in futures) if pool else map(read_csv, resolved)
+        with pd.HDFStore(str(h5_path), mode="w") as store:
+            for path, df in zip(resolved, frames):
+                name = path.stem
+                # index=False: no PyTables index on the row index; VIME reads
+                # by row range and never queries it
+                store.put(f"/{name}", df, format=fmt, index=False)
+                print(f"  {name}: {len(df)} rows")
+    finally:
+        if pool is not None:
+            # Drop files not yet parsed after an error (by hand: shutdown's
+            # cancel_futures needs Python 3.9)
+            for f in futures:
+                f.cancel()
+            pool.shutdown()
 
     print(f"Wrote {len(resolved)} tables to {h5_path}")
 
@@ -64,7 +216,19 @@ def main():
         default=None,
         help="Directory containing the CSV files (csv_files are basenames)",
     )
+    ap.add_argument(
+        "--fixed",
+        action="store_true",
+        help='Write pandas "fixed" format tables (faster to write, not row-queryable)',
+    )
+    ap.add_argument(
+        "--chunked",
+        action="store_true",
+        help="Read and append each CSV in chunks to bound memory on large files",
+    )
     args = ap.parse_args()
+    if args.chunked and args.fixed:
+        ap.error("--chunked requires table format; drop --fixed")
 
     # If a single argument is an existing directory, use all .csv files in it
     if len(args.csv_files) == 1:
@@ -74,10 +238,12 @@ def main():
             if not csv_paths:
                 print(f"No .csv files in {p}", file=sys.stderr)
                 sys.exit(1)
-            csv_to_h5([str(f) for f in csv_paths], args.output, directory=None)
+            csv_to_h5([str(f) for f in csv_paths], args.output, directory=None,
+                      fixed=args.fixed, chunked=args.chunked)
             return
 
-    csv_to_h5(args.csv_files, args.output, directory=args.dir)
+    csv_to_h5(args.csv_files, args.output, directory=args.dir, fixed=args.fixed,
+              chunked=args.chunked)
 
 
 if __name__ == "__main__":
@@ -1,27 +1,72 @@
 import os
 import sys
 import argparse
-from tabulate import tabulate
 # import data_model as DataModel # custom library. Essentially a wrapper for h5py.
-import h5py # for reading h5 files
-import curses
 
 
-def output_table(data): 
-    if data.extractions.is_table_available(args.tablename):
-        table = data.extractions[args.tablename]
-        print(tabulate(table, headers=table.columns, stralign="left", numalign="left", showindex=False, tablefmt="grid"))
+def _format_column(col):
+    # One fixed format per dtype, so every chunk prints numbers the same way.
+    if col.dtype.kind == "f":
+        return col.map("{:.6g}".format)
+    return col.astype(str)
+
+
+def output_table(h5_file, tablename, max_rows=200, start=0, stop=None):
+    # Stream the table in row chunks so memory stays flat. A first pass over the
+    # chunks measures the column widths, so all chunks line up under one header.
+    if max_rows:
+        stop = start + max_rows if stop is None else min(stop, start + max_rows)
+    import pandas as pd # deferred so --help doesn't pay for it
+
+    with pd.HDFStore(h5_file, mode="r") as store:
+        if tablename not in store:
+            print(f"Table not found: {tablename}", file=sys.stderr)
+            return False
+        if store.get_storer(tablename).is_table:
+            def chunks():
+                return store.select(tablename, start=start, stop=stop, iterator=True, chunksize=10_000)
+        else:
+            whole = [store.select(tablename, start=start, stop=stop)]
+            def chunks():
+                return whole
+
+        headers = None
+        widths = None
+        for chunk in chunks():
+            if headers is None:
+                headers = [str(c) for c in chunk.columns]
+                widths = [len(h) for h in headers]
+            for i in range(chunk.shape[1]):
+                if len(chunk):
+                    widths[i] = max(widths[i], int(_format_column(chunk.iloc[:, i]).str.len().max()))
+        if headers is None:
+            return True
+
+        out = open(sys.stdout.fileno(), "w", buffering=1 << 20, closefd=False)
+        out.write(" ".join(h.ljust(w) for h, w in zip(headers, widths)).rstrip() + "\n")
+        for chunk in chunks():
+            if not len(chunk):
+                continue
+            cells = [_format_column(chunk.iloc[:, i]).str.ljust(w) for i, w in enumerate(widths)]
+            rows = cells[0].str.cat(cells[1:], sep=" ") if len(cells) > 1 else cells[0]
+            out.write("\n".join(rows.str.rstrip()) + "\n")
+        out.flush()
+    return True
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
+    parser.add_argument('h5_file', type=str)
     parser.add_argument('-t', '--tablename', type=str)
+    parser.add_argument('--max-rows', type=int, default=200)
+    parser.add_argument('--start', type=int, default=0)
+    parser.add_argument('--stop', type=int)
 
     args = parser.parse_args()
 
     cwd = os.getcwd()
     h5_file = os.path.join(cwd, args.h5_file)
-    data = h5py.File(h5_file, 'r')
     
     if args.tablename:
-        output_table(data, args.tablename)
\ No newline at end of file
+        if not output_table(h5_file, args.tablename, args.max_rows, args.start, args.stop):
+            sys.exit(1)